@@ -0,0 +1,167 @@
+"""Packed asset archive shared by the launcher and the build.
+
+Kept free of Kivy so the build can pack assets without creating a window:
+
+    python asset_bundle.py assets.pak
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+ASSET_BUNDLE_MAGIC = b"WWPK"
+ASSET_BUNDLE_VERSION = 1
+ASSET_BUNDLE_SOURCES: tuple[str, ...] = ("launcher.kv", "config.json", "assets")
+ASSET_BUNDLE_NAME = "assets.pak"
+
+_ASSET_BUNDLE_HEADER = struct.Struct("<4sII")
+
+
+class MemoryReader(io.RawIOBase):
+    """Seekable file object over a memoryview, so readers never copy the whole entry."""
+
+    def __init__(self, data: memoryview):
+        super().__init__()
+        self._data = data
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._data)}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        chunk = self._data[self._pos:self._pos + len(buffer)]
+        size = len(chunk)
+        memoryview(buffer).cast("B")[:size] = chunk
+        self._pos += size
+        return size
+
+
+@dataclass(frozen=True)
+class BundledAsset:
+    name: str
+    data: memoryview
+
+    @property
+    def suffix(self) -> str:
+        return Path(self.name).suffix.lower()
+
+
+class AssetBundle:
+    """Read-only view over a packed asset archive mapped into memory.
+
+    Layout: header (magic, version, index size), a JSON index mapping
+    POSIX-style relative names to ``[offset, size]`` pairs, then the raw file
+    contents. Offsets are relative to the end of the index.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            view = memoryview(self._mmap)
+            magic, version, index_size = _ASSET_BUNDLE_HEADER.unpack_from(view)
+            if magic != ASSET_BUNDLE_MAGIC or version != ASSET_BUNDLE_VERSION:
+                raise ValueError(f"Unsupported asset bundle: {path}")
+            data_start = _ASSET_BUNDLE_HEADER.size + index_size
+            index = json.loads(str(view[_ASSET_BUNDLE_HEADER.size:data_start], "utf-8"))
+            self._entries: dict[str, tuple[int, int]] = {}
+            for name, (offset, size) in index.items():
+                start = data_start + int(offset)
+                if start + int(size) > len(view):
+                    raise ValueError(f"Truncated asset bundle entry: {name}")
+                self._entries[name] = (start, int(size))
+            self._view = view
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def names(self, prefix: str = "") -> list[str]:
+        return sorted(name for name in self._entries if name.startswith(prefix))
+
+    def get(self, name: str) -> memoryview | None:
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        start, size = entry
+        return self._view[start:start + size]
+
+    def read_text(self, name: str) -> str | None:
+        data = self.get(name)
+        return None if data is None else str(data, "utf-8")
+
+    def read_json(self, name: str):
+        text = self.read_text(name)
+        return None if text is None else json.loads(text)
+
+    def asset(self, name: str) -> BundledAsset | None:
+        data = self.get(name)
+        return None if data is None else BundledAsset(name, data)
+
+
+def build_asset_bundle(
+    dest: Path,
+    base: Path,
+    sources: Sequence[str] = ASSET_BUNDLE_SOURCES,
+) -> int:
+    files: dict[str, Path] = {}
+    for source in sources:
+        path = base / source
+        if path.is_file():
+            files[Path(source).as_posix()] = path
+        elif path.is_dir():
+            for child in path.rglob("*"):
+                if child.is_file():
+                    files[child.relative_to(base).as_posix()] = child
+    index: dict[str, list[int]] = {}
+    offset = 0
+    for name in sorted(files):
+        size = files[name].stat().st_size
+        index[name] = [offset, size]
+        offset += size
+    index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_suffix(dest.suffix + ".tmp")
+    with open(tmp, "wb") as out:
+        out.write(_ASSET_BUNDLE_HEADER.pack(ASSET_BUNDLE_MAGIC, ASSET_BUNDLE_VERSION, len(index_bytes)))
+        out.write(index_bytes)
+        for name in sorted(files):
+            with open(files[name], "rb") as src:
+                shutil.copyfileobj(src, out)
+    os.replace(tmp, dest)
+    return len(files)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = list(sys.argv[1:] if argv is None else argv)
+    base = Path(__file__).resolve().parent
+    dest = Path(args[0]) if args else base / ASSET_BUNDLE_NAME
+    count = build_asset_bundle(dest, base)
+    print(f"Packed {count} files into {dest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,39 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import errno
+import hashlib
+import io
+import itertools
 import json
+import multiprocessing
+import os
+import sqlite3
 import subprocess
 import sys
-from dataclasses import dataclass
+import threading
+import time
+import traceback
+import urllib.error
+import urllib.parse
+import urllib.request
+import webbrowser
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Callable, Sequence
+from typing import Any, Awaitable, Callable, Mapping, Sequence
 
 import shutil
 
+from asset_bundle import ASSET_BUNDLE_NAME, AssetBundle, BundledAsset, MemoryReader
+
 try:
     from kivy.animation import Animation
     from kivy.app import App
+    from kivy.clock import Clock
     from kivy.lang import Builder
     from kivy.metrics import dp
     from kivy.properties import BooleanProperty, NumericProperty, ObjectProperty, StringProperty
@@ -24,7 +46,12 @@ try:
     from kivy.uix.widget import Widget
     from kivy.core.image import Image as CoreImage
     from kivy.graphics import Color, Rectangle
-    from kivy.core.window import Window
+    from kivy.graphics.texture import Texture
+    if multiprocessing.current_process().name == "MainProcess" and "--multiprocessing-fork" not in sys.argv:
+        from kivy.core.window import Window
+    else:
+        # Pool workers re-import this module; importing Window would open a window in each.
+        Window = None
 except Exception as exc:  # pragma: no cover - import-time helper
     missing = "kivy" if isinstance(exc, ModuleNotFoundError) else None
     print(
@@ -36,6 +63,11 @@ except Exception as exc:  # pragma: no cover - import-time helper
     if __name__ == "__main__":
         sys.exit(1)
 
+try:
+    from PIL import Image as PILImage
+except Exception:  # pragma: no cover - optional, images are decoded on the UI thread without it
+    PILImage = None
+
 
 APP_TITLE = "Wuthering Waves Launcher"
 APP_ID = "WutheringWavesLauncher"
@@ -43,6 +75,7 @@ IS_FROZEN = getattr(sys, "frozen", False)
 APP_ROOT = Path(sys.executable).resolve().parent if IS_FROZEN else Path(__file__).resolve().parent
 BASE_PATH = Path(getattr(sys, "_MEIPASS", APP_ROOT))
 KV_FILE = BASE_PATH / "launcher.kv"
+ASSET_BUNDLE_FILE = BASE_PATH / ASSET_BUNDLE_NAME
 ASSETS_DIR = BASE_PATH / "assets"
 LANG_DIR = ASSETS_DIR / "lang"
 DEFAULT_ASSETS_UI_DIR = ASSETS_DIR / "ui_assets"
@@ -54,6 +87,70 @@ USER_ASSETS_DIR = USER_DATA_DIR / "assets"
 USER_LANG_DIR = USER_ASSETS_DIR / "lang"
 UI_ASSETS_DIR = USER_ASSETS_DIR / "ui_assets"
 BACKGROUND_BASENAME = "background"
+DISK_USAGE_CACHE_FILE = USER_DATA_DIR / "disk_usage.json"
+DISK_USAGE_CACHE_VERSION = 2
+DISK_USAGE_WORKERS = 8
+DISK_USAGE_TOP_ENTRIES = 15
+HTTP_CACHE_DIR = USER_DATA_DIR / "cache" / "http"
+HTTP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+HTTP_TIMEOUT = 10
+NEWS_IMAGE_MAX_SIZE = (640, 360)
+TASK_IO = "io"
+TASK_CPU = "cpu"
+TASK_QUEUED = "queued"
+TASK_RUNNING = "running"
+TASK_DONE = "done"
+TASK_FAILED = "failed"
+TASK_CANCELLED = "cancelled"
+TASK_PRIORITY_LOW = -10
+TASK_PRIORITY_NORMAL = 0
+TASK_PRIORITY_HIGH = 10
+TASK_IO_SLOTS = 4
+TASK_CPU_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+CONFIG_SAVE_DELAY = 0.5
+GAME_EXE_NAME = "Wuthering Waves.exe"
+# The exe above is a bootstrap stub that starts the real client and exits.
+GAME_SHIPPING_EXE_NAME = "Client-Win64-Shipping.exe"
+GAME_CHILD_TIMEOUT = 60.0
+GAME_POLL_INTERVAL = 1.0
+GAME_INI_DIR = Path("Client") / "Saved" / "Config" / "WindowsNoEditor"
+GAME_LOCAL_STORAGE_DIR = Path("Client") / "Saved" / "LocalStorage"
+GAME_LOCAL_STORAGE_GLOB = "LocalStorage*.db"
+GAME_QUALITY_KEY = "GameQualitySetting"
+GAME_SETTINGS_BACKUP_DIR = USER_DATA_DIR / "settings_backups"
+GAME_SETTINGS_BACKUP_LIMIT = 10
+MOVE_JOURNAL_NAME = ".launcher-move.journal"
+MOVE_COPY_WORKERS = 4
+MOVE_BUFFER_SIZE = 8 * 1024 * 1024
+MOVE_PROGRESS_INTERVAL = 0.25
+MOD_STORE_DIR = USER_DATA_DIR / "mods"
+MOD_BACKUP_DIR = USER_DATA_DIR / "mods_backup"
+MOD_MANIFEST_FILE = USER_DATA_DIR / "mods.json"
+MOD_PAK_DIR = "Client/Content/Paks/~mods"
+MOD_PAK_SUFFIXES: tuple[str, ...] = (".pak", ".utoc", ".ucas", ".sig")
+GAME_SCREENSHOT_DIRS: tuple[Path, ...] = (
+    Path("Client") / "Saved" / "ScreenShot",
+    Path("Client") / "Saved" / "Screenshots",
+)
+BACKGROUND_HISTORY_DIR = USER_DATA_DIR / "backgrounds"
+GALLERY_SUFFIXES: tuple[str, ...] = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
+THUMBNAIL_CACHE_DIR = USER_DATA_DIR / "cache" / "thumbnails"
+THUMBNAIL_CACHE_MAX_BYTES = 32 * 1024 * 1024
+THUMBNAIL_SIZE = (320, 180)
+THUMBNAIL_QUALITY = 80
+THUMBNAIL_BATCH = 16
+SNAPSHOT_DIR = USER_DATA_DIR / "snapshots"
+SNAPSHOT_SOURCES: tuple[Path, ...] = (Path("Client") / "Saved" / "Config", GAME_LOCAL_STORAGE_DIR)
+SNAPSHOT_CHUNK_SIZE = 1024 * 1024
+SNAPSHOT_COMPRESSION_LEVEL = 6
+SNAPSHOT_SQLITE_SIDECARS: tuple[str, ...] = ("-wal", "-shm", "-journal")
+DEFAULT_SNAPSHOT_RETENTION: dict[str, int] = {"keep_last": 5, "keep_daily": 7, "keep_weekly": 4}
+PROCESS_PRIORITIES: tuple[str, ...] = ("idle", "below_normal", "normal", "above_normal", "high")
+DEFAULT_LAUNCH_PROFILE = "default"
+DEFAULT_LAUNCH_PROFILES: dict[str, dict] = {
+    "default": {},
+    "performance": {"game_priority": "above_normal", "launcher_priority": "idle"},
+}
 DEFAULT_LANG = "pl_PL"
 FALLBACK_LANG = "en_US"
 
@@ -69,6 +166,7 @@ MENU_ENTRIES: tuple[MenuEntry, ...] = (
     MenuEntry("H", "menu.home", "home"),
     MenuEntry("L", "menu.library", "library"),
     MenuEntry("S", "menu.store", "store"),
+    MenuEntry("G", "menu.gallery", "gallery"),
     MenuEntry("U", "menu.settings", "settings"),
 )
 
@@ -132,6 +230,287 @@ KV_FALLBACK = """
         shorten: True
         shorten_from: 'right'
 
+<StorageView>:
+    orientation: 'vertical'
+    spacing: dp(8)
+    padding: [dp(8), dp(8), dp(8), dp(8)]
+    Label:
+        text: root.status_text
+        size_hint_y: None
+        height: self.texture_size[1] + dp(8)
+        halign: 'left'
+        valign: 'middle'
+        text_size: self.width, None
+    ScrollView:
+        do_scroll_x: False
+        Label:
+            text: root.summary_text
+            markup: True
+            font_name: 'RobotoMono-Regular'
+            size_hint_y: None
+            height: self.texture_size[1] + dp(8)
+            halign: 'left'
+            valign: 'top'
+            text_size: self.width, None
+
+<PerformanceView>:
+    orientation: 'vertical'
+    spacing: dp(8)
+    padding: [dp(8), dp(8), dp(8), dp(8)]
+    Label:
+        text: root.values_text
+        halign: 'left'
+        valign: 'top'
+        text_size: self.size
+    BoxLayout:
+        size_hint_y: None
+        height: dp(44)
+        spacing: dp(12)
+        Label:
+            text: app.translate('performance.preset_label') if app else 'Preset applied at launch'
+            halign: 'left'
+            valign: 'middle'
+            text_size: self.size
+        Spinner:
+            id: preset_spinner
+            size_hint_x: None
+            width: dp(200)
+            values: root.preset_values
+            text: root.preset_text
+    BoxLayout:
+        size_hint_y: None
+        height: dp(44)
+        spacing: dp(12)
+        Button:
+            id: apply_button
+            text: app.translate('performance.apply') if app else 'Apply now'
+        Button:
+            id: restore_button
+            text: app.translate('performance.restore') if app else 'Restore backup'
+    Label:
+        text: root.status_text
+        size_hint_y: None
+        height: self.texture_size[1] + dp(8)
+        halign: 'left'
+        valign: 'middle'
+        text_size: self.width, None
+
+<MoveView>:
+    orientation: 'vertical'
+    spacing: dp(8)
+    padding: [dp(8), dp(8), dp(8), dp(8)]
+    Label:
+        text: root.status_text
+        halign: 'left'
+        valign: 'middle'
+        text_size: self.width, None
+    ProgressBar:
+        max: 1
+        value: root.progress
+        size_hint_y: None
+        height: dp(24)
+    Label:
+        text: root.detail_text
+        size_hint_y: None
+        height: self.texture_size[1] + dp(8)
+        halign: 'left'
+        valign: 'middle'
+        text_size: self.width, None
+    Button:
+        id: close_button
+        text: app.translate('move.close') if app else 'Close'
+        size_hint_y: None
+        height: dp(44)
+
+<MoveResumeView>:
+    orientation: 'vertical'
+    spacing: dp(8)
+    padding: [dp(8), dp(8), dp(8), dp(8)]
+    Label:
+        text: root.status_text
+        halign: 'left'
+        valign: 'middle'
+        text_size: self.width, None
+    BoxLayout:
+        size_hint_y: None
+        height: dp(44)
+        spacing: dp(8)
+        Button:
+            id: resume_button
+            text: app.translate('move.resume') if app else 'Resume'
+        Button:
+            id: cancel_button
+            text: app.translate('move.cancel') if app else 'Cancel move'
+
+<ModRow>:
+    size_hint_y: None
+    height: dp(44)
+    spacing: dp(12)
+    CheckBox:
+        id: check
+        size_hint_x: None
+        width: dp(44)
+        active: root.enabled
+    Label:
+        text: root.mod_name
+        halign: 'left'
+        valign: 'middle'
+        text_size: self.size
+        shorten: True
+    Label:
+        text: root.detail
+        size_hint_x: None
+        width: dp(180)
+        halign: 'right'
+        valign: 'middle'
+        text_size: self.size
+
+<ModsView>:
+    orientation: 'vertical'
+    spacing: dp(8)
+    padding: [dp(8), dp(8), dp(8), dp(8)]
+    ScrollView:
+        do_scroll_x: False
+        BoxLayout:
+            id: mod_list
+            orientation: 'vertical'
+            size_hint_y: None
+            height: self.minimum_height
+            spacing: dp(4)
+    Label:
+        text: root.status_text
+        size_hint_y: None
+        height: self.texture_size[1] + dp(8)
+        halign: 'left'
+        valign: 'middle'
+        text_size: self.width, None
+    BoxLayout:
+        size_hint_y: None
+        height: dp(44)
+        spacing: dp(12)
+        Button:
+            id: import_button
+            text: app.translate('mods.import') if app else 'Import mod folder'
+        Button:
+            id: rollback_button
+            text: app.translate('mods.rollback') if app else 'Disable all mods'
+
+<SnapshotsView>:
+    orientation: 'vertical'
+    spacing: dp(8)
+    padding: [dp(8), dp(8), dp(8), dp(8)]
+    ScrollView:
+        do_scroll_x: False
+        Label:
+            text: root.summary_text
+            font_name: 'RobotoMono-Regular'
+            size_hint_y: None
+            height: self.texture_size[1] + dp(8)
+            halign: 'left'
+            valign: 'top'
+            text_size: self.width, None
+    BoxLayout:
+        size_hint_y: None
+        height: dp(44)
+        spacing: dp(12)
+        Spinner:
+            id: snapshot_spinner
+            values: root.snapshot_values
+            text: root.snapshot_text
+        Button:
+            id: restore_button
+            size_hint_x: None
+            width: dp(160)
+            text: app.translate('snapshots.restore') if app else 'Restore'
+        Button:
+            id: create_button
+            size_hint_x: None
+            width: dp(160)
+            text: app.translate('snapshots.create') if app else 'Create snapshot'
+    Label:
+        text: root.status_text
+        size_hint_y: None
+        height: self.texture_size[1] + dp(8)
+        halign: 'left'
+        valign: 'middle'
+        text_size: self.width, None
+
+<TaskListView>:
+    orientation: 'vertical'
+    padding: [dp(8), dp(8), dp(8), dp(8)]
+    ScrollView:
+        do_scroll_x: False
+        Label:
+            text: root.summary_text
+            font_name: 'RobotoMono-Regular'
+            size_hint_y: None
+            height: self.texture_size[1] + dp(8)
+            halign: 'left'
+            valign: 'top'
+            text_size: self.width, None
+
+<GalleryTile>:
+    orientation: 'vertical'
+    spacing: dp(4)
+    padding: [dp(4), dp(4), dp(4), dp(4)]
+    canvas.before:
+        Color:
+            rgba: 0, 0, 0, 0.35
+        RoundedRectangle:
+            pos: self.pos
+            size: self.size
+            radius: [dp(6), dp(6), dp(6), dp(6)]
+    AsyncImage:
+        source: root.thumbnail
+        opacity: 1 if root.thumbnail else 0
+        fit_mode: 'contain'
+    Label:
+        text: root.title
+        font_size: '12sp'
+        size_hint_y: None
+        height: dp(18)
+        shorten: True
+        text_size: self.width, None
+        halign: 'center'
+
+<NewsCard>:
+    orientation: 'horizontal'
+    size_hint_y: None
+    height: dp(140)
+    spacing: dp(12)
+    padding: [dp(8), dp(8), dp(8), dp(8)]
+    canvas.before:
+        Color:
+            rgba: 0, 0, 0, 0.35
+        RoundedRectangle:
+            pos: self.pos
+            size: self.size
+            radius: [dp(8), dp(8), dp(8), dp(8)]
+    Image:
+        texture: root.texture
+        opacity: 1 if root.texture else 0
+        size_hint_x: None
+        width: dp(220)
+        fit_mode: 'contain'
+    BoxLayout:
+        orientation: 'vertical'
+        spacing: dp(4)
+        Label:
+            text: root.title
+            bold: True
+            size_hint_y: None
+            height: self.texture_size[1] + dp(4)
+            halign: 'left'
+            valign: 'top'
+            text_size: self.width, None
+            shorten: True
+        Label:
+            text: root.text
+            halign: 'left'
+            valign: 'top'
+            text_size: self.size
+            shorten: True
+
 <LauncherRoot>:
     sidebar: sidebar
     content_manager: content_sm
@@ -192,65 +571,151 @@ KV_FALLBACK = """
                     padding: [0, dp(16), dp(16), dp(16)]
                     spacing: dp(12)
                     Label:
-                        text: 'Sklep w przygotowaniu'
+                        id: store_status
+                        text: ''
                         size_hint_y: None
                         height: self.texture_size[1] + dp(12)
                         halign: 'left'
                         valign: 'middle'
                         text_size: self.width, None
-                    Widget:
+                    ScrollView:
+                        do_scroll_x: False
+                        BoxLayout:
+                            id: news_list
+                            orientation: 'vertical'
+                            size_hint_y: None
+                            height: self.minimum_height
+                            spacing: dp(12)
             Screen:
-                name: 'settings'
+                name: 'gallery'
                 BoxLayout:
                     orientation: 'vertical'
-                    padding: [dp(16), dp(16), dp(16), dp(16)]
+                    padding: [0, dp(16), dp(16), dp(16)]
                     spacing: dp(12)
                     Label:
-                        id: game_dir_label
-                        text: app.translate('settings.game_dir_label') if app else 'Game directory'
+                        id: gallery_status
+                        text: ''
                         size_hint_y: None
                         height: self.texture_size[1] + dp(12)
                         halign: 'left'
                         valign: 'middle'
                         text_size: self.width, None
+                    RecycleView:
+                        id: gallery_view
+                        viewclass: 'GalleryTile'
+                        do_scroll_x: False
+                        RecycleGridLayout:
+                            cols: max(1, int(self.width // dp(236)))
+                            default_size: None, dp(170)
+                            default_size_hint: 1, None
+                            size_hint_y: None
+                            height: self.minimum_height
+                            spacing: dp(8)
+            Screen:
+                name: 'settings'
+                ScrollView:
+                    do_scroll_x: False
                     BoxLayout:
+                        orientation: 'vertical'
                         size_hint_y: None
-                        height: dp(48)
+                        height: self.minimum_height
+                        padding: [dp(16), dp(16), dp(16), dp(16)]
                         spacing: dp(12)
                         Label:
-                            id: game_dir_value
-                            text: app.root.game_dir if app and app.root and app.root.game_dir else (app.translate('status.not_set') if app else 'Game directory: not set')
-                            size_hint_x: 1
+                            id: game_dir_label
+                            text: app.translate('settings.game_dir_label') if app else 'Game directory'
+                            size_hint_y: None
+                            height: self.texture_size[1] + dp(12)
                             halign: 'left'
                             valign: 'middle'
                             text_size: self.width, None
+                        BoxLayout:
+                            size_hint_y: None
+                            height: dp(48)
+                            spacing: dp(12)
+                            Label:
+                                id: game_dir_value
+                                text: app.root.game_dir if app and app.root and app.root.game_dir else (app.translate('status.not_set') if app else 'Game directory: not set')
+                                size_hint_x: 1
+                                halign: 'left'
+                                valign: 'middle'
+                                text_size: self.width, None
+                            Button:
+                                id: choose_button
+                                text: app.translate('settings.select_folder') if app else 'Select folder'
+                                size_hint: None, None
+                                size: dp(160), dp(44)
+                                on_release: app.root.open_file_dialog() if app.root else None
                         Button:
-                            id: choose_button
-                            text: app.translate('settings.select_folder') if app else 'Select folder'
+                            id: background_button
+                            text: app.translate('settings.change_background') if app else 'Change background'
                             size_hint: None, None
-                            size: dp(160), dp(44)
-                            on_release: app.root.open_file_dialog() if app.root else None
-                    Button:
-                        id: background_button
-                        text: app.translate('settings.change_background') if app else 'Change background'
-                        size_hint: None, None
-                        size: dp(200), dp(44)
-                        on_release: app.select_background() if app else None
-                    Label:
-                        id: language_label
-                        text: app.translate('settings.language_label') if app else 'Language'
-                        size_hint_y: None
-                        height: self.texture_size[1] + dp(12)
-                        halign: 'left'
-                        valign: 'middle'
-                        text_size: self.width, None
-                    Spinner:
-                        id: language_spinner
-                        size_hint: None, None
-                        size: dp(220), dp(44)
-                        values: []
-                        on_text: app.on_language_selected(self.text) if app else None
-                    Widget:
+                            size: dp(200), dp(44)
+                            on_release: app.select_background() if app else None
+                        Button:
+                            id: storage_button
+                            text: app.translate('settings.storage') if app else 'Storage usage'
+                            size_hint: None, None
+                            size: dp(200), dp(44)
+                            on_release: app.open_storage_view() if app else None
+                        Button:
+                            id: performance_button
+                            text: app.translate('settings.performance') if app else 'Performance settings'
+                            size_hint: None, None
+                            size: dp(200), dp(44)
+                            on_release: app.open_performance_view() if app else None
+                        Button:
+                            id: mods_button
+                            text: app.translate('settings.mods') if app else 'Mods'
+                            size_hint: None, None
+                            size: dp(200), dp(44)
+                            on_release: app.open_mods_view() if app else None
+                        Button:
+                            id: snapshots_button
+                            text: app.translate('settings.snapshots') if app else 'Snapshots'
+                            size_hint: None, None
+                            size: dp(200), dp(44)
+                            on_release: app.open_snapshots_view() if app else None
+                        Button:
+                            id: move_button
+                            text: app.translate('settings.move_install') if app else 'Move installation'
+                            size_hint: None, None
+                            size: dp(200), dp(44)
+                            on_release: app.open_move_view() if app else None
+                        Button:
+                            id: tasks_button
+                            text: app.translate('settings.tasks') if app else 'Background tasks'
+                            size_hint: None, None
+                            size: dp(200), dp(44)
+                            on_release: app.open_task_view() if app else None
+                        Label:
+                            id: launch_profile_label
+                            text: app.translate('settings.launch_profile_label') if app else 'Launch profile'
+                            size_hint_y: None
+                            height: self.texture_size[1] + dp(12)
+                            halign: 'left'
+                            valign: 'middle'
+                            text_size: self.width, None
+                        Spinner:
+                            id: launch_profile_spinner
+                            size_hint: None, None
+                            size: dp(220), dp(44)
+                            values: []
+                            on_text: app.on_launch_profile_selected(self.text) if app else None
+                        Label:
+                            id: language_label
+                            text: app.translate('settings.language_label') if app else 'Language'
+                            size_hint_y: None
+                            height: self.texture_size[1] + dp(12)
+                            halign: 'left'
+                            valign: 'middle'
+                            text_size: self.width, None
+                        Spinner:
+                            id: language_spinner
+                            size_hint: None, None
+                            size: dp(220), dp(44)
+                            values: []
+                            on_text: app.on_language_selected(self.text) if app else None
     Sidebar:
         id: sidebar
         pos: dp(16), dp(16)
@@ -259,24 +724,42 @@ KV_FALLBACK = """
 """
 
 
+@lru_cache(maxsize=None)
+def get_asset_bundle(path: Path = ASSET_BUNDLE_FILE) -> AssetBundle | None:
+    if not path.is_file():
+        return None
+    try:
+        return AssetBundle(path)
+    except Exception:
+        return None
+
 
 def load_config(
     path: Path = CONFIG_FILE,
     fallbacks: Sequence[Path] = CONFIG_FALLBACKS,
+    bundle: AssetBundle | None = None,
 ) -> tuple[dict, bool]:
     primary_exists = path.exists()
-    candidates: list[tuple[Path, bool]] = [(path, False)]
+    if primary_exists:
+        try:
+            return json.loads(path.read_text(encoding="utf-8")), False
+        except Exception:
+            pass
+    if bundle is not None:
+        try:
+            data = bundle.read_json("config.json")
+        except Exception:
+            data = None
+        if data is not None:
+            return data, True
     for fallback in fallbacks:
-        if fallback and fallback != path:
-            candidates.append((fallback, True))
-    for candidate, needs_save in candidates:
-        if not candidate.exists():
+        if not fallback or fallback == path or not fallback.exists():
             continue
         try:
-            data = json.loads(candidate.read_text(encoding="utf-8"))
+            data = json.loads(fallback.read_text(encoding="utf-8"))
         except Exception:
             continue
-        return data, needs_save
+        return data, True
     return {}, not primary_exists
 def save_config(cfg: dict, path: Path = CONFIG_FILE) -> None:
     path = path.expanduser()
@@ -284,7 +767,9 @@ def save_config(cfg: dict, path: Path = CONFIG_FILE) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
     except Exception:
         pass
-    path.write_text(json.dumps(cfg, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(cfg, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def info_popup(title: str, message: str) -> None:
@@ -296,154 +781,2628 @@ def info_popup(title: str, message: str) -> None:
     ).open()
 
 
-class HoverBehavior:
-    """Mixin that toggles a boolean when the pointer enters or leaves the widget."""
+def format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
 
-    hovered = BooleanProperty(False)
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.register_event_type("on_enter")
-        self.register_event_type("on_leave")
-        Window.bind(mouse_pos=self._on_mouse_pos)
+@dataclass
+class DirUsage:
+    """Sizes of the files directly inside one directory."""
 
-    def _on_mouse_pos(self, window, pos):
-        if not self.get_root_window():
-            return
-        inside = self.collide_point(*self.to_widget(*pos))
-        if self.hovered == inside:
-            return
-        self.hovered = inside
-        if inside:
-            self.dispatch("on_enter")
-        else:
-            self.dispatch("on_leave")
+    size: int = 0
+    count: int = 0
+    extensions: dict[str, int] = field(default_factory=dict)
+    subdirs: tuple[str, ...] = ()
 
-    def on_enter(self):  # pragma: no cover - hook for subclasses
-        pass
+    def to_json(self) -> dict:
+        return {
+            "size": self.size,
+            "count": self.count,
+            "extensions": self.extensions,
+            "subdirs": list(self.subdirs),
+        }
 
-    def on_leave(self):  # pragma: no cover - hook for subclasses
-        pass
+    @classmethod
+    def from_json(cls, data: dict) -> DirUsage:
+        return cls(
+            size=int(data.get("size", 0)),
+            count=int(data.get("count", 0)),
+            extensions={str(k): int(v) for k, v in data.get("extensions", {}).items()},
+            subdirs=tuple(data.get("subdirs", ())),
+        )
 
 
-class SidebarButton(ButtonBehavior, BoxLayout):
-    sidebar = ObjectProperty(None, rebind=True)
-    icon_text = StringProperty("")
-    text_label = StringProperty("")
-    label_key = StringProperty("")
-    screen_name = StringProperty("home")
+@dataclass(frozen=True)
+class UsageSummary:
+    total: int
+    files: int
+    folders: tuple[tuple[str, int], ...]
+    extensions: tuple[tuple[str, int], ...]
 
-    def __init__(self, **kwargs):
-        super().__init__(orientation="horizontal", **kwargs)
 
-    def on_release(self):
-        if self.sidebar:
-            self.sidebar.select(self.screen_name)
+def load_disk_usage_cache(root: Path, path: Path = DISK_USAGE_CACHE_FILE) -> dict[str, DirUsage]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != DISK_USAGE_CACHE_VERSION or data.get("root") != str(root):
+            return {}
+        return {rel: DirUsage.from_json(entry) for rel, entry in data.get("entries", {}).items()}
+    except Exception:
+        return {}
 
 
-class Sidebar(HoverBehavior, BoxLayout):
-    expanded_width = NumericProperty(dp(220))
-    collapsed_width = NumericProperty(dp(72))
-    label_width = NumericProperty(0)
-    labels_opacity = NumericProperty(0)
-    active_screen = StringProperty("home")
-    show_labels = BooleanProperty(False)
-    menu_container = ObjectProperty(None)
+def save_disk_usage_cache(
+    root: Path,
+    entries: Mapping[str, DirUsage],
+    path: Path = DISK_USAGE_CACHE_FILE,
+) -> None:
+    payload = {
+        "version": DISK_USAGE_CACHE_VERSION,
+        "root": str(root),
+        "entries": {rel: usage.to_json() for rel, usage in entries.items()},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.width = self.collapsed_width
-        self._callback: Callable[[str], None] | None = None
-        self._buttons: list[SidebarButton] = []
 
-    def on_kv_post(self, base_widget):
-        self.width = self.collapsed_width
-        self.label_width = 0
-        self.labels_opacity = 0
-        self.show_labels = False
+def _scan_directory(path: Path) -> DirUsage | None:
+    # Every directory is listed in full on each scan; the cache only provides
+    # the previous totals to show while it runs. On Windows the sizes come with
+    # the listing itself.
+    usage = DirUsage()
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                ext = os.path.splitext(entry.name)[1].lower()
+                usage.size += size
+                usage.count += 1
+                usage.extensions[ext] = usage.extensions.get(ext, 0) + size
+    except OSError:
+        return None
+    usage.subdirs = tuple(sorted(subdirs))
+    return usage
 
-    def on_hovered(self, instance, value):
-        self.show_labels = bool(value)
-        target_width = self.expanded_width if value else self.collapsed_width
-        target_label_width = max(0, self.expanded_width - self.collapsed_width) if value else 0
-        target_opacity = 1 if value else 0
-        Animation.cancel_all(self, "width", "label_width", "labels_opacity")
-        Animation(
-            width=target_width,
-            label_width=target_label_width,
-            labels_opacity=target_opacity,
-            duration=0.25,
-            t="out_quad",
-        ).start(self)
 
-    def populate(self, entries: Sequence[MenuEntry], callback: Callable[[str], None]) -> None:
-        self._callback = callback
-        container = self.menu_container
-        if container is None:
-            return
-        container.clear_widgets()
-        self._buttons = []
-        app = App.get_running_app()
-        for entry in entries:
-            button = SidebarButton(
-                sidebar=self,
-                icon_text=entry.icon,
-                label_key=entry.label_key,
-                screen_name=entry.screen,
-            )
-            if app:
-                button.text_label = app.translate(entry.label_key)
-            else:
-                button.text_label = entry.label_key
-            container.add_widget(button)
-            self._buttons.append(button)
-        container.add_widget(Widget(size_hint_y=1))
+def scan_disk_usage(
+    root: Path,
+    cache: Mapping[str, DirUsage] | None = None,
+    *,
+    workers: int = DISK_USAGE_WORKERS,
+    on_progress: Callable[[dict[str, DirUsage]], None] | None = None,
+    progress_interval: float = 0.25,
+    cancel: threading.Event | None = None,
+) -> dict[str, DirUsage]:
+    cache = cache or {}
+    result: dict[str, DirUsage] = {}
+    last_report = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending = {pool.submit(_scan_directory, root): "."}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                rel = pending.pop(future)
+                usage = future.result()
+                if usage is None:
+                    continue
+                result[rel] = usage
+                for name in usage.subdirs:
+                    child = name if rel == "." else f"{rel}/{name}"
+                    pending[pool.submit(_scan_directory, root / child)] = child
+            if cancel is not None and cancel.is_set():
+                for future in pending:
+                    future.cancel()
+                return {**cache, **result}
+            if on_progress and time.monotonic() - last_report >= progress_interval:
+                last_report = time.monotonic()
+                on_progress({**cache, **result})
+    return result
 
-    def update_labels(self):
-        app = App.get_running_app()
-        if not app:
-            return
-        for button in self._buttons:
-            button.text_label = app.translate(button.label_key)
 
-    def select(self, screen_name: str, dispatch: bool = True) -> None:
-        self.active_screen = screen_name
-        if dispatch and self._callback:
-            self._callback(screen_name)
+def summarize_disk_usage(entries: Mapping[str, DirUsage], limit: int = DISK_USAGE_TOP_ENTRIES) -> UsageSummary:
+    folders: dict[str, int] = {}
+    extensions: dict[str, int] = {}
+    total = files = 0
+    for rel, usage in entries.items():
+        top = rel.split("/", 1)[0]
+        folders[top] = folders.get(top, 0) + usage.size
+        for ext, size in usage.extensions.items():
+            extensions[ext] = extensions.get(ext, 0) + size
+        total += usage.size
+        files += usage.count
 
+    def top_n(values: dict[str, int]) -> tuple[tuple[str, int], ...]:
+        return tuple(sorted(values.items(), key=lambda item: item[1], reverse=True)[:limit])
 
-class LauncherRoot(FloatLayout):
-    sidebar = ObjectProperty(None)
-    content_manager = ObjectProperty(None)
-    game_dir = StringProperty("")
-    can_play = BooleanProperty(False)
-    status_text = StringProperty("Game directory: not set")
-    current_screen = StringProperty("home")
-    content_padding_left = NumericProperty(dp(16) + dp(72))
+    return UsageSummary(total, files, top_n(folders), top_n(extensions))
 
-    def __init__(self, **kwargs):
-        self._bg_rect = None
-        self._bg_color = None
-        self._background_source: str | None = None
-        super().__init__(**kwargs)
-        self._ensure_background_canvas()
 
-    def on_kv_post(self, base_widget):
-        self.bind(can_play=self._sync_play_button, status_text=self._sync_status_label)
-        if self.sidebar:
-            self.sidebar.populate(MENU_ENTRIES, self.switch_to)
-            self.sidebar.select(self.current_screen, dispatch=False)
-            self.content_padding_left = dp(16) + self.sidebar.collapsed_width
+@dataclass(frozen=True)
+class CachedResponse:
+    data: bytes
+    etag: str = ""
+    last_modified: str = ""
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    data: bytes
+    from_cache: bool
+    offline: bool = False
+
+
+class HttpCache:
+    """On-disk HTTP response cache with least-recently-used eviction."""
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, directory: Path = HTTP_CACHE_DIR, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: dict[str, dict] = {}
+        try:
+            self._index = json.loads((directory / self.INDEX_NAME).read_text(encoding="utf-8"))
+        except Exception:
+            self._index = {}
+
+    @staticmethod
+    def _file_name(url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _save_index(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.directory / (self.INDEX_NAME + ".tmp")
+        tmp.write_text(json.dumps(self._index, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self.directory / self.INDEX_NAME)
+
+    def total_size(self) -> int:
+        with self._lock:
+            return sum(entry["size"] for entry in self._index.values())
+
+    def get(self, url: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                return None
+            try:
+                data = (self.directory / entry["file"]).read_bytes()
+            except OSError:
+                self._index.pop(url, None)
+                return None
+            entry["last_access"] = time.time()
+            return CachedResponse(data, entry.get("etag", ""), entry.get("last_modified", ""))
+
+    def touch(self, url: str, etag: str | None = None, last_modified: str | None = None) -> None:
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                return
+            entry["last_access"] = time.time()
+            if etag:
+                entry["etag"] = etag
+            if last_modified:
+                entry["last_modified"] = last_modified
+            self._save_index()
+
+    def put(self, url: str, data: bytes, etag: str | None = None, last_modified: str | None = None) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            name = self._file_name(url)
+            tmp = self.directory / (name + ".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, self.directory / name)
+            self._index[url] = {
+                "file": name,
+                "size": len(data),
+                "etag": etag or "",
+                "last_modified": last_modified or "",
+                "last_access": time.time(),
+            }
+            total = sum(entry["size"] for entry in self._index.values())
+            for victim, entry in sorted(self._index.items(), key=lambda item: item[1]["last_access"]):
+                if total <= self.max_bytes:
+                    break
+                if victim == url:
+                    continue
+                try:
+                    (self.directory / entry["file"]).unlink()
+                except OSError:
+                    pass
+                del self._index[victim]
+                total -= entry["size"]
+            self._save_index()
+
+
+def fetch_with_cache(url: str, cache: HttpCache, timeout: float = HTTP_TIMEOUT) -> FetchResult:
+    cached = cache.get(url)
+    request = urllib.request.Request(url, headers={"User-Agent": APP_ID})
+    if cached is not None:
+        if cached.etag:
+            request.add_header("If-None-Match", cached.etag)
+        if cached.last_modified:
+            request.add_header("If-Modified-Since", cached.last_modified)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            data = response.read()
+            cache.put(url, data, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            return FetchResult(data, from_cache=False)
+    except urllib.error.HTTPError as exc:
+        if cached is None:
+            raise
+        if exc.code == 304:
+            cache.touch(url, exc.headers.get("ETag"), exc.headers.get("Last-Modified"))
+            return FetchResult(cached.data, from_cache=True)
+        return FetchResult(cached.data, from_cache=True, offline=True)
+    except (urllib.error.URLError, OSError):
+        if cached is None:
+            raise
+        return FetchResult(cached.data, from_cache=True, offline=True)
+
+
+@dataclass(frozen=True)
+class NewsItem:
+    title: str
+    text: str = ""
+    image: str = ""
+    link: str = ""
+
+
+def _web_url(base_url: str, value: Any) -> str:
+    # Feed links end up in webbrowser.open and urlopen; anything but http(s),
+    # such as file:// or a bare C: path, could open local files or programs.
+    if not value:
+        return ""
+    url = urllib.parse.urljoin(base_url, str(value))
+    return url if urllib.parse.urlparse(url).scheme in ("http", "https") else ""
+
+
+def parse_news_feed(data: bytes, base_url: str) -> list[NewsItem]:
+    payload = json.loads(data.decode("utf-8"))
+    entries = payload.get("items", []) if isinstance(payload, dict) else payload
+    items: list[NewsItem] = []
+    for entry in entries:
+        if not isinstance(entry, dict) or not entry.get("title"):
+            continue
+        items.append(
+            NewsItem(
+                title=str(entry["title"]),
+                text=str(entry.get("text") or ""),
+                image=_web_url(base_url, entry.get("image")),
+                link=_web_url(base_url, entry.get("link")),
+            )
+        )
+    return items
+
+
+@dataclass(frozen=True)
+class DecodedImage:
+    size: tuple[int, int]
+    pixels: bytes
+
+
+def decode_image(
+    data: bytes | memoryview,
+    max_size: tuple[int, int] | None = NEWS_IMAGE_MAX_SIZE,
+) -> DecodedImage | bytes | memoryview:
+    if PILImage is None:
+        return data
+    # Bundled assets arrive as memoryviews over the mapped archive; reading
+    # them through MemoryReader avoids copying the whole file first.
+    stream = io.BytesIO(data) if isinstance(data, bytes) else MemoryReader(data)
+    with PILImage.open(stream) as image:
+        if max_size is not None:
+            image.thumbnail(max_size)
+        rgba = image.convert("RGBA")
+        return DecodedImage(rgba.size, rgba.tobytes())
+
+
+def texture_from_image(image: DecodedImage | bytes | memoryview, ext: str = "png") -> Texture:
+    if isinstance(image, DecodedImage):
+        texture = Texture.create(size=image.size, colorfmt="rgba")
+        texture.blit_buffer(image.pixels, colorfmt="rgba", bufferfmt="ubyte")
+        texture.flip_vertical()
+        return texture
+    return CoreImage(io.BytesIO(image), ext=ext).texture
+
+
+def read_cached_news(url: str) -> tuple[HttpCache, list[NewsItem]]:
+    """Opens the HTTP cache and parses the saved feed, so the store renders offline."""
+    cache = HttpCache()
+    cached = cache.get(url)
+    if cached is None:
+        return cache, []
+    try:
+        return cache, parse_news_feed(cached.data, url)
+    except Exception:
+        return cache, []
+
+
+def fetch_news(url: str, cache: HttpCache) -> tuple[list[NewsItem], bool]:
+    result = fetch_with_cache(url, cache)
+    return parse_news_feed(result.data, url), result.offline
+
+
+def fetch_news_image(url: str, cache: HttpCache, cached_only: bool = False) -> FetchResult | None:
+    if not cached_only:
+        return fetch_with_cache(url, cache)
+    cached = cache.get(url)
+    return None if cached is None else FetchResult(cached.data, from_cache=True)
+
+
+def decode_news_image_task(ctx: TaskContext, data: bytes) -> DecodedImage | bytes:
+    return decode_image(data)
+
+
+class TaskContext:
+    """Handed to task callables to report progress and observe cancellation.
+
+    ``report`` may be called from any thread; the update is forwarded to the
+    event loop, so ``on_progress`` callbacks can touch widgets directly.
+    """
+
+    def __init__(self, scheduler: TaskScheduler, task: BackgroundTask):
+        self._scheduler = scheduler
+        self.task = task
+        self.cancelled = threading.Event()
+
+    def report(self, progress: float | None = None, message: str | None = None, payload: Any = None) -> None:
+        self._scheduler._report(self.task, progress, message, payload)
+
+
+@dataclass(eq=False)
+class BackgroundTask:
+    id: int
+    name: str
+    kind: str
+    priority: int = TASK_PRIORITY_NORMAL
+    state: str = TASK_QUEUED
+    progress: float | None = None
+    message: str = ""
+    result: Any = None
+    error: BaseException | None = None
+    on_done: Callable[[BackgroundTask], None] | None = field(default=None, repr=False)
+    on_progress: Callable[[BackgroundTask, Any], None] | None = field(default=None, repr=False)
+    runner: Callable[[BackgroundTask], Awaitable] | None = field(default=None, repr=False)
+    future: asyncio.Future | None = field(default=None, repr=False)
+    context: TaskContext | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (TASK_DONE, TASK_FAILED, TASK_CANCELLED)
+
+
+class TaskScheduler:
+    """Priority queues of I/O coroutines and CPU-bound callables on the app's asyncio loop.
+
+    I/O tasks are coroutines run directly on the loop; CPU tasks run in a
+    thread pool (or a process pool for picklable callables). Submission,
+    cancellation and every callback happen on the loop thread, which is the
+    thread Kivy draws on when the app runs through ``async_run``.
+    """
+
+    def __init__(self, io_slots: int = TASK_IO_SLOTS, cpu_workers: int = TASK_CPU_WORKERS):
+        self.io_slots = max(1, io_slots)
+        self.cpu_workers = max(1, cpu_workers)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queues: dict[str, asyncio.PriorityQueue] = {}
+        self._workers: list[asyncio.Task] = []
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._tasks: dict[int, BackgroundTask] = {}
+        self._listeners: list[Callable[[BackgroundTask], None]] = []
+        self._ids = itertools.count(1)
+
+    @property
+    def started(self) -> bool:
+        return self._loop is not None
+
+    def start(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        if self._loop is not None:
+            return
+        self._loop = loop or asyncio.get_running_loop()
+        self._thread_pool = ThreadPoolExecutor(max_workers=self.cpu_workers, thread_name_prefix="launcher-task")
+        for kind, slots in ((TASK_IO, self.io_slots), (TASK_CPU, self.cpu_workers)):
+            queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+            self._queues[kind] = queue
+            for _ in range(slots):
+                self._workers.append(self._loop.create_task(self._worker(queue)))
+
+    def shutdown(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        for task in list(self._tasks.values()):
+            if task.context is not None:
+                task.context.cancelled.set()
+        self._loop = None
+
+    def add_listener(self, listener: Callable[[BackgroundTask], None]) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[BackgroundTask], None]) -> None:
+        try:
+            self._listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def active(self) -> list[BackgroundTask]:
+        return sorted(
+            self._tasks.values(),
+            key=lambda task: (task.state != TASK_RUNNING, -task.priority, task.id),
+        )
+
+    def submit_io(
+        self,
+        name: str,
+        func: Callable[[TaskContext], Awaitable],
+        *,
+        priority: int = TASK_PRIORITY_NORMAL,
+        on_done: Callable[[BackgroundTask], None] | None = None,
+        on_progress: Callable[[BackgroundTask, Any], None] | None = None,
+    ) -> BackgroundTask:
+        return self._submit(name, TASK_IO, priority, lambda task: func(task.context), on_done, on_progress)
+
+    def submit_cpu(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        priority: int = TASK_PRIORITY_NORMAL,
+        use_process: bool = False,
+        on_done: Callable[[BackgroundTask], None] | None = None,
+        on_progress: Callable[[BackgroundTask, Any], None] | None = None,
+    ) -> BackgroundTask:
+        # Thread tasks receive the TaskContext as their first argument; process
+        # tasks only get ``args`` because the context cannot be pickled.
+        def run(task: BackgroundTask) -> Awaitable:
+            if use_process:
+                return self._loop.run_in_executor(self._get_process_pool(), partial(func, *args))
+            return self._loop.run_in_executor(self._thread_pool, partial(func, task.context, *args))
+
+        return self._submit(name, TASK_CPU, priority, run, on_done, on_progress)
+
+    def cancel(self, task: BackgroundTask | None) -> None:
+        if task is None or task.finished:
+            return
+        if task.context is not None:
+            task.context.cancelled.set()
+        previous = task.state
+        task.state = TASK_CANCELLED
+        if previous == TASK_QUEUED:
+            self._finish(task)
+        elif task.future is not None:
+            task.future.cancel()
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.cpu_workers)
+        return self._process_pool
+
+    def _submit(self, name, kind, priority, runner, on_done, on_progress) -> BackgroundTask:
+        if self._loop is None:
+            raise RuntimeError("TaskScheduler.start() has not been called")
+        task = BackgroundTask(
+            id=next(self._ids),
+            name=name,
+            kind=kind,
+            priority=priority,
+            on_done=on_done,
+            on_progress=on_progress,
+            runner=runner,
+        )
+        task.context = TaskContext(self, task)
+        self._tasks[task.id] = task
+        self._queues[kind].put_nowait((-priority, task.id, task))
+        self._notify(task)
+        return task
+
+    async def _worker(self, queue: asyncio.PriorityQueue) -> None:
+        while True:
+            _, _, task = await queue.get()
+            if task.state != TASK_QUEUED:
+                continue
+            task.state = TASK_RUNNING
+            self._notify(task)
+            task.future = asyncio.ensure_future(task.runner(task))
+            try:
+                task.result = await task.future
+                if task.state == TASK_RUNNING:
+                    task.state = TASK_DONE
+            except asyncio.CancelledError:
+                if task.state != TASK_CANCELLED:
+                    # The worker itself is being shut down.
+                    task.state = TASK_CANCELLED
+                    self._finish(task)
+                    raise
+            except Exception as exc:
+                task.error = exc
+                task.state = TASK_FAILED
+            self._finish(task)
+
+    def _report(self, task: BackgroundTask, progress, message, payload) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._apply_progress, task, progress, message, payload)
+
+    def _apply_progress(self, task: BackgroundTask, progress, message, payload) -> None:
+        if task.finished:
+            return
+        if progress is not None:
+            task.progress = max(0.0, min(1.0, float(progress)))
+        if message is not None:
+            task.message = message
+        self._notify(task)
+        if task.on_progress is not None:
+            try:
+                task.on_progress(task, payload)
+            except Exception:
+                traceback.print_exc()
+
+    def _finish(self, task: BackgroundTask) -> None:
+        if self._tasks.pop(task.id, None) is None:
+            return
+        self._notify(task)
+        if task.on_done is not None:
+            try:
+                task.on_done(task)
+            except Exception:
+                traceback.print_exc()
+
+    def _notify(self, task: BackgroundTask) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(task)
+            except Exception:
+                traceback.print_exc()
+
+
+def running_scheduler() -> TaskScheduler | None:
+    tasks = getattr(App.get_running_app(), "tasks", None)
+    return tasks if tasks is not None and tasks.started else None
+
+
+def probe_game_dir(dir_path: Path | None) -> tuple[bool, bool]:
+    if dir_path is None or not dir_path.exists():
+        return False, False
+    return True, (dir_path / GAME_EXE_NAME).exists()
+
+
+def load_image_task(ctx: TaskContext, source: Path | bytes | memoryview) -> DecodedImage | bytes | memoryview:
+    data = source.read_bytes() if isinstance(source, Path) else source
+    return decode_image(data, max_size=None)
+
+
+def scan_disk_usage_task(ctx: TaskContext, root_dir: Path, cache: dict[str, DirUsage]) -> UsageSummary:
+    entries = scan_disk_usage(
+        root_dir,
+        cache,
+        on_progress=lambda snapshot: ctx.report(payload=summarize_disk_usage(snapshot)),
+        cancel=ctx.cancelled,
+    )
+    save_disk_usage_cache(root_dir, entries)
+    return summarize_disk_usage(entries)
+
+
+async def move_installation_task(ctx: TaskContext, src: Path, dest: Path) -> bool:
+    def report(progress: MoveProgress) -> None:
+        fraction = progress.done_bytes / progress.total_bytes if progress.total_bytes else 1.0
+        ctx.report(progress=fraction, payload=progress)
+
+    # Copying is disk-bound, so it runs on its own thread instead of holding a CPU worker.
+    copy = asyncio.ensure_future(asyncio.to_thread(move_installation, src, dest, cancel=ctx.cancelled, on_progress=report))
+    try:
+        return await asyncio.shield(copy)
+    except asyncio.CancelledError:
+        # Wait for the copy to journal its partial files before the task counts as finished.
+        ctx.cancelled.set()
+        await asyncio.wait([copy])
+        raise
+
+
+@dataclass(frozen=True)
+class SettingLocation:
+    store: str  # "ini" or "sqlite"
+    key: str
+    section: str = ""
+    file: str = "GameUserSettings.ini"
+    fmt: str = "int"  # "int", "float" or "bool"
+
+
+_GAME_USER_SETTINGS = "/Script/Engine.GameUserSettings"
+_QUALITY_GROUPS = ("ViewDistance", "AntiAliasing", "Shadow", "PostProcess", "Texture", "Effects", "Foliage", "Shading")
+
+GAME_SETTING_LOCATIONS: dict[str, tuple[SettingLocation, ...]] = {
+    "fps_cap": (
+        SettingLocation("sqlite", "KeyCustomFrameRate"),
+        SettingLocation("ini", "FrameRateLimit", _GAME_USER_SETTINGS, fmt="float"),
+    ),
+    "vsync": (
+        SettingLocation("sqlite", "KeyPcVsync", fmt="bool"),
+        SettingLocation("ini", "bUseVSync", _GAME_USER_SETTINGS, fmt="bool"),
+    ),
+    "resolution_scale": (SettingLocation("ini", "sg.ResolutionQuality", "ScalabilityGroups", fmt="float"),),
+    "quality": tuple(SettingLocation("ini", f"sg.{group}Quality", "ScalabilityGroups") for group in _QUALITY_GROUPS),
+}
+
+PERFORMANCE_PRESETS: dict[str, dict[str, Any]] = {
+    "competitive": {"fps_cap": 120, "vsync": False, "resolution_scale": 100, "quality": 0},
+    "balanced": {"fps_cap": 60, "vsync": False, "resolution_scale": 100, "quality": 2},
+    "quality": {"fps_cap": 60, "vsync": True, "resolution_scale": 100, "quality": 3},
+}
+
+
+def _format_setting(location: SettingLocation, value: Any) -> Any:
+    if location.store == "sqlite":
+        return int(bool(value)) if location.fmt == "bool" else int(value)
+    if location.fmt == "bool":
+        return "True" if value else "False"
+    if location.fmt == "float":
+        return f"{float(value):.6f}"
+    return str(int(value))
+
+
+def _parse_setting(location: SettingLocation, raw: Any) -> Any:
+    try:
+        if location.fmt == "bool":
+            return str(raw).strip().lower() in ("1", "true")
+        if location.fmt == "float":
+            return round(float(raw), 2)
+        return int(float(raw))
+    except (TypeError, ValueError):
+        return None
+
+
+def _ini_section(line: str) -> str | None:
+    stripped = line.strip().lstrip("\ufeff")
+    if stripped.startswith("[") and stripped.endswith("]"):
+        return stripped[1:-1]
+    return None
+
+
+def read_ini_value(text: str, section: str, key: str) -> str | None:
+    current = None
+    for line in text.splitlines():
+        header = _ini_section(line)
+        if header is not None:
+            current = header
+            continue
+        if current == section and "=" in line:
+            name, value = line.split("=", 1)
+            if name.strip() == key:
+                return value.strip()
+    return None
+
+
+def update_ini_text(text: str, values: Mapping[str, Mapping[str, str]]) -> str:
+    # Unreal ini files repeat keys and are case sensitive, which configparser
+    # cannot round-trip, so lines are edited in place and everything else kept.
+    newline = "\r\n" if "\r\n" in text else "\n"
+    pending = {section: dict(options) for section, options in values.items()}
+    out: list[str] = []
+    current: str | None = None
+
+    def flush(section: str | None) -> None:
+        remaining = pending.pop(section, None) if section is not None else None
+        if not remaining:
+            return
+        trailing = 0
+        while out and not out[-1].strip():
+            out.pop()
+            trailing += 1
+        out.extend(f"{key}={value}" for key, value in remaining.items())
+        out.extend([""] * trailing)
+
+    for line in text.splitlines():
+        header = _ini_section(line)
+        if header is not None:
+            flush(current)
+            current = header
+        elif current in pending and "=" in line and not line.lstrip().startswith((";", "#")):
+            key = line.split("=", 1)[0].strip()
+            if key in pending[current]:
+                out.append(f"{key}={pending[current].pop(key)}")
+                continue
+        out.append(line)
+    flush(current)
+    for section, options in pending.items():
+        if not options:
+            continue
+        if out and out[-1].strip():
+            out.append("")
+        out.append(f"[{section}]")
+        out.extend(f"{key}={value}" for key, value in options.items())
+    result = newline.join(out)
+    return result + newline if text.endswith(("\n", "\r")) or not text else result
+
+
+def find_game_settings_files(game_dir: Path) -> tuple[dict[str, Path], list[Path]]:
+    ini_names = {location.file for locations in GAME_SETTING_LOCATIONS.values() for location in locations if location.store == "ini"}
+    ini_files = {name: game_dir / GAME_INI_DIR / name for name in sorted(ini_names) if (game_dir / GAME_INI_DIR / name).is_file()}
+    databases = sorted((game_dir / GAME_LOCAL_STORAGE_DIR).glob(GAME_LOCAL_STORAGE_GLOB))
+    return ini_files, databases
+
+
+def _read_ini(path: Path) -> str:
+    with open(path, encoding="utf-8", errors="surrogateescape", newline="") as handle:
+        return handle.read()
+
+
+def _read_quality_json(db_path: Path) -> dict | None:
+    conn = sqlite3.connect(db_path, timeout=5)
+    try:
+        row = conn.execute("SELECT value FROM LocalStorage WHERE key = ?", (GAME_QUALITY_KEY,)).fetchone()
+    finally:
+        conn.close()
+    if row is None:
+        return None
+    data = json.loads(row[0])
+    return data if isinstance(data, dict) else None
+
+
+def read_game_settings(game_dir: Path) -> dict[str, Any]:
+    ini_files, databases = find_game_settings_files(game_dir)
+    ini_text = {name: _read_ini(path) for name, path in ini_files.items()}
+    quality: dict | None = None
+    for db_path in databases:
+        try:
+            quality = _read_quality_json(db_path)
+        except (sqlite3.Error, ValueError):
+            quality = None
+        if quality is not None:
+            break
+    values: dict[str, Any] = {}
+    for name, locations in GAME_SETTING_LOCATIONS.items():
+        for location in locations:
+            if location.store == "sqlite":
+                raw = quality.get(location.key) if quality is not None else None
+            else:
+                text = ini_text.get(location.file)
+                raw = read_ini_value(text, location.section, location.key) if text is not None else None
+            if raw is not None:
+                values[name] = _parse_setting(location, raw)
+                break
+    return values
+
+
+def _copy_database(src: Path, dest: Path) -> None:
+    # The SQLite backup API copies a consistent snapshot even with a WAL file.
+    source = sqlite3.connect(src, timeout=5)
+    try:
+        target = sqlite3.connect(dest)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+
+def backup_game_settings(
+    game_dir: Path,
+    backup_root: Path = GAME_SETTINGS_BACKUP_DIR,
+    pinned: bool = False,
+) -> Path:
+    ini_files, databases = find_game_settings_files(game_dir)
+    files = list(ini_files.values()) + databases
+    if not files:
+        raise FileNotFoundError(f"No game settings found in {game_dir}")
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    dest = backup_root / stamp
+    suffix = 1
+    while dest.exists():
+        suffix += 1
+        dest = backup_root / f"{stamp}-{suffix}"
+    dest.mkdir(parents=True)
+    relative: list[str] = []
+    for path in files:
+        rel = path.relative_to(game_dir)
+        target = dest / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".db":
+            _copy_database(path, target)
+        else:
+            shutil.copy2(path, target)
+        relative.append(rel.as_posix())
+    manifest = {"game_dir": str(game_dir), "created": time.time(), "files": relative, "pinned": pinned}
+    (dest / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    if pinned:
+        # Only the newest copy of the player's own settings stays pinned per game directory.
+        for old in list_settings_backups(backup_root):
+            manifest = _read_backup_manifest(old)
+            if old != dest and manifest.get("pinned") and manifest.get("game_dir") == str(game_dir):
+                manifest["pinned"] = False
+                (old / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    # Pinned backups never count towards the limit, so rotation cannot delete the originals.
+    backups = [backup for backup in list_settings_backups(backup_root) if not _read_backup_manifest(backup).get("pinned")]
+    for old in backups[GAME_SETTINGS_BACKUP_LIMIT:]:
+        shutil.rmtree(old, ignore_errors=True)
+    return dest
+
+
+def _read_backup_manifest(backup: Path) -> dict[str, Any]:
+    try:
+        manifest = json.loads((backup / "manifest.json").read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def list_settings_backups(backup_root: Path = GAME_SETTINGS_BACKUP_DIR) -> list[Path]:
+    if not backup_root.is_dir():
+        return []
+    backups = [entry for entry in backup_root.iterdir() if (entry / "manifest.json").is_file()]
+    return sorted(backups, key=lambda entry: entry.name, reverse=True)
+
+
+def latest_settings_backup(
+    game_dir: Path,
+    backup_root: Path = GAME_SETTINGS_BACKUP_DIR,
+    pinned: bool = False,
+) -> Path | None:
+    for backup in list_settings_backups(backup_root):
+        manifest = _read_backup_manifest(backup)
+        if manifest.get("game_dir") == str(game_dir) and (manifest.get("pinned") or not pinned):
+            return backup
+    return None
+
+
+def rekey_settings_backups(old_dir: Path, new_dir: Path, backup_root: Path = GAME_SETTINGS_BACKUP_DIR) -> int:
+    moved = 0
+    for backup in list_settings_backups(backup_root):
+        manifest = _read_backup_manifest(backup)
+        if manifest.get("game_dir") == str(old_dir):
+            manifest["game_dir"] = str(new_dir)
+            (backup / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+            moved += 1
+    return moved
+
+
+def _matches_settings(current: Mapping[str, Any], values: Mapping[str, Any]) -> bool:
+    return all(current.get(name) == value for name, value in values.items())
+
+
+def restore_game_settings(backup: Path, game_dir: Path) -> None:
+    manifest = json.loads((backup / "manifest.json").read_text(encoding="utf-8"))
+    for rel in manifest.get("files", []):
+        source = backup / rel
+        target = game_dir / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.suffix == ".db":
+            _copy_database(source, target)
+        else:
+            tmp = target.with_name(target.name + ".tmp")
+            shutil.copy2(source, tmp)
+            os.replace(tmp, target)
+
+
+def apply_game_settings(
+    game_dir: Path,
+    values: Mapping[str, Any],
+    backup_root: Path = GAME_SETTINGS_BACKUP_DIR,
+) -> Path | None:
+    """Write ``values`` into the game's settings and return the backup taken first.
+
+    Nothing is written or backed up when the files already hold ``values``. When
+    the current settings are not one of the presets they are the player's own,
+    so the backup is pinned: it survives rotation and is what "Restore backup"
+    puts back.
+    """
+    current = read_game_settings(game_dir)
+    if _matches_settings(current, values):
+        return None
+    from_preset = any(_matches_settings(current, preset) for preset in PERFORMANCE_PRESETS.values())
+    pinned = not from_preset or latest_settings_backup(game_dir, backup_root, pinned=True) is None
+    backup = backup_game_settings(game_dir, backup_root, pinned=pinned)
+    ini_files, databases = find_game_settings_files(game_dir)
+    ini_updates: dict[str, dict[str, dict[str, str]]] = {}
+    sqlite_updates: dict[str, Any] = {}
+    for name, value in values.items():
+        for location in GAME_SETTING_LOCATIONS.get(name, ()):
+            formatted = _format_setting(location, value)
+            if location.store == "sqlite":
+                sqlite_updates[location.key] = formatted
+            elif location.file in ini_files:
+                ini_updates.setdefault(location.file, {}).setdefault(location.section, {})[location.key] = formatted
+    try:
+        for db_path in databases:
+            if not sqlite_updates:
+                break
+            conn = sqlite3.connect(db_path, timeout=5, isolation_level=None)
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute("SELECT value FROM LocalStorage WHERE key = ?", (GAME_QUALITY_KEY,)).fetchone()
+                if row is not None:
+                    data = json.loads(row[0])
+                    data.update(sqlite_updates)
+                    conn.execute(
+                        "UPDATE LocalStorage SET value = ? WHERE key = ?",
+                        (json.dumps(data, separators=(",", ":")), GAME_QUALITY_KEY),
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+        for file_name, sections in ini_updates.items():
+            path = ini_files[file_name]
+            text = _read_ini(path)
+            tmp = path.with_name(path.name + ".tmp")
+            with open(tmp, "w", encoding="utf-8", errors="surrogateescape", newline="") as handle:
+                handle.write(update_ini_text(text, sections))
+            os.replace(tmp, path)
+    except Exception:
+        restore_game_settings(backup, game_dir)
+        raise
+    return backup
+
+
+_WINDOWS_PRIORITY_CLASSES = {
+    "idle": 0x00000040,
+    "below_normal": 0x00004000,
+    "normal": 0x00000020,
+    "above_normal": 0x00008000,
+    "high": 0x00000080,
+}
+_POSIX_NICE = {"idle": 19, "below_normal": 10, "normal": 0, "above_normal": -5, "high": -10}
+_PROCESS_QUERY_INFORMATION = 0x0400
+_PROCESS_SET_INFORMATION = 0x0200
+
+
+def parse_cpu_list(value: Any) -> tuple[int, ...]:
+    if not value:
+        return ()
+    if isinstance(value, str):
+        cpus: set[int] = set()
+        for part in value.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            if "-" in part:
+                start, end = part.split("-", 1)
+                cpus.update(range(int(start), int(end) + 1))
+            else:
+                cpus.add(int(part))
+        return tuple(sorted(cpus))
+    return tuple(sorted({int(cpu) for cpu in value}))
+
+
+@dataclass(frozen=True)
+class LaunchProfile:
+    name: str
+    game_priority: str = "normal"
+    game_affinity: tuple[int, ...] = ()
+    launcher_priority: str = "normal"
+    launcher_affinity: tuple[int, ...] = ()
+
+    @classmethod
+    def from_json(cls, name: str, data: Mapping[str, Any]) -> LaunchProfile:
+        def priority(key: str) -> str:
+            value = str(data.get(key) or "normal")
+            return value if value in PROCESS_PRIORITIES else "normal"
+
+        return cls(
+            name=name,
+            game_priority=priority("game_priority"),
+            game_affinity=parse_cpu_list(data.get("game_affinity")),
+            launcher_priority=priority("launcher_priority"),
+            launcher_affinity=parse_cpu_list(data.get("launcher_affinity")),
+        )
+
+
+def load_launch_profiles(cfg: Mapping[str, Any]) -> dict[str, LaunchProfile]:
+    profiles: dict[str, LaunchProfile] = {}
+    raw = cfg.get("launch_profiles")
+    for name, data in (raw if isinstance(raw, dict) else DEFAULT_LAUNCH_PROFILES).items():
+        try:
+            profiles[name] = LaunchProfile.from_json(name, data if isinstance(data, dict) else {})
+        except (TypeError, ValueError):
+            continue
+    profiles.setdefault(DEFAULT_LAUNCH_PROFILE, LaunchProfile(DEFAULT_LAUNCH_PROFILE))
+    return profiles
+
+
+@dataclass(frozen=True)
+class ProcessState:
+    priority: int | None
+    affinity: tuple[int, ...]
+
+
+def _open_windows_process(pid: int | None):
+    import ctypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    if pid is None:
+        return kernel32, kernel32.GetCurrentProcess(), False
+    handle = kernel32.OpenProcess(_PROCESS_QUERY_INFORMATION | _PROCESS_SET_INFORMATION, False, pid)
+    if not handle:
+        raise ctypes.WinError(ctypes.get_last_error())
+    return kernel32, handle, True
+
+
+def get_process_state(pid: int | None = None) -> ProcessState:
+    if sys.platform == "win32":
+        import ctypes
+
+        kernel32, handle, owned = _open_windows_process(pid)
+        try:
+            priority = kernel32.GetPriorityClass(handle) or None
+            process_mask = ctypes.c_size_t()
+            system_mask = ctypes.c_size_t()
+            affinity: tuple[int, ...] = ()
+            if kernel32.GetProcessAffinityMask(handle, ctypes.byref(process_mask), ctypes.byref(system_mask)):
+                affinity = tuple(cpu for cpu in range(process_mask.value.bit_length()) if process_mask.value >> cpu & 1)
+            return ProcessState(priority, affinity)
+        finally:
+            if owned:
+                kernel32.CloseHandle(handle)
+    target = pid or 0
+    priority = os.getpriority(os.PRIO_PROCESS, target) if hasattr(os, "getpriority") else None
+    affinity = tuple(sorted(os.sched_getaffinity(target))) if hasattr(os, "sched_getaffinity") else ()
+    return ProcessState(priority, affinity)
+
+
+def set_process_state(pid: int | None, priority: int | None = None, affinity: Sequence[int] = ()) -> None:
+    # ``priority`` is a raw Windows priority class or POSIX nice value.
+    if sys.platform == "win32":
+        import ctypes
+
+        kernel32, handle, owned = _open_windows_process(pid)
+
+        def set_priority() -> None:
+            if not kernel32.SetPriorityClass(handle, priority):
+                raise ctypes.WinError(ctypes.get_last_error())
+
+        def set_affinity() -> None:
+            mask = sum(1 << cpu for cpu in affinity)
+            if not kernel32.SetProcessAffinityMask(handle, ctypes.c_size_t(mask)):
+                raise ctypes.WinError(ctypes.get_last_error())
+    else:
+        handle, owned = None, False
+        target = pid or 0
+
+        def set_priority() -> None:
+            if hasattr(os, "setpriority"):
+                os.setpriority(os.PRIO_PROCESS, target, priority)
+
+        def set_affinity() -> None:
+            if hasattr(os, "sched_setaffinity"):
+                os.sched_setaffinity(target, affinity)
+
+    # Priority and affinity are applied independently so one failing never skips the other.
+    errors: list[OSError] = []
+    try:
+        for needed, apply in ((priority is not None, set_priority), (bool(affinity), set_affinity)):
+            if not needed:
+                continue
+            try:
+                apply()
+            except OSError as exc:
+                errors.append(exc)
+    finally:
+        if owned:
+            kernel32.CloseHandle(handle)
+    if errors:
+        raise errors[0]
+
+
+def _can_restore_nice(nice: int) -> bool:
+    # Unprivileged POSIX processes may raise their nice value but not lower it again.
+    if hasattr(os, "geteuid") and os.geteuid() == 0:
+        return True
+    try:
+        import resource
+
+        soft, _hard = resource.getrlimit(resource.RLIMIT_NICE)
+    except (ImportError, AttributeError, OSError, ValueError):
+        return False
+    return soft == resource.RLIM_INFINITY or 20 - soft <= nice
+
+
+def priority_value(name: str) -> int:
+    table = _WINDOWS_PRIORITY_CLASSES if sys.platform == "win32" else _POSIX_NICE
+    return table.get(name, table["normal"])
+
+
+def apply_launch_profile(profile: LaunchProfile, game_pid: int) -> tuple[ProcessState, list[OSError]]:
+    """Applies ``profile`` to the game and the launcher; returns the launcher's previous state.
+
+    Failures (for example raising priority without the right privileges) are
+    collected instead of raised so they never prevent the game from running.
+    """
+    saved = get_process_state()
+    available = set(saved.affinity)
+    errors: list[OSError] = []
+    for pid, priority, affinity in (
+        (game_pid, profile.game_priority, profile.game_affinity),
+        (None, profile.launcher_priority, profile.launcher_affinity),
+    ):
+        cpus = tuple(cpu for cpu in affinity if cpu in available) if available else tuple(affinity)
+        value = priority_value(priority) if priority != "normal" else None
+        if (
+            pid is None
+            and value is not None
+            and sys.platform != "win32"
+            and saved.priority is not None
+            and value > saved.priority
+            and not _can_restore_nice(saved.priority)
+        ):
+            errors.append(PermissionError(errno.EPERM, f"Launcher priority '{priority}' could not be undone, skipped"))
+            value = None
+        if value is None and not cpus:
+            continue
+        try:
+            set_process_state(pid, priority=value, affinity=cpus)
+        except OSError as exc:
+            errors.append(exc)
+    return saved, errors
+
+
+_TH32CS_SNAPPROCESS = 0x00000002
+_SYNCHRONIZE = 0x00100000
+_WAIT_TIMEOUT = 0x00000102
+
+
+def find_child_process(parent_pid: int, exe_name: str) -> int | None:
+    """Returns the pid of a process named ``exe_name`` started by ``parent_pid``.
+
+    Windows keeps the parent pid after the parent exits, so the client can
+    still be found once the bootstrap stub is gone.
+    """
+    name = exe_name.lower()
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESSENTRY32W(ctypes.Structure):
+            _fields_ = [
+                ("dwSize", wintypes.DWORD),
+                ("cntUsage", wintypes.DWORD),
+                ("th32ProcessID", wintypes.DWORD),
+                ("th32DefaultHeapID", ctypes.c_size_t),
+                ("th32ModuleID", wintypes.DWORD),
+                ("cntThreads", wintypes.DWORD),
+                ("th32ParentProcessID", wintypes.DWORD),
+                ("pcPriClassBase", wintypes.LONG),
+                ("dwFlags", wintypes.DWORD),
+                ("szExeFile", wintypes.WCHAR * 260),
+            ]
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        snapshot = kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+        if snapshot in (None, wintypes.HANDLE(-1).value):
+            return None
+        try:
+            entry = PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(entry)
+            found = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+            while found:
+                if entry.th32ParentProcessID == parent_pid and entry.szExeFile.lower() == name:
+                    return int(entry.th32ProcessID)
+                found = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        finally:
+            kernel32.CloseHandle(snapshot)
+        return None
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            cmdline = (entry / "cmdline").read_bytes().split(b"\0")[0].decode(errors="replace")
+        except OSError:
+            continue
+        # The command name is wrapped in parentheses and may itself contain spaces.
+        fields = stat[stat.rfind(")") + 2:].split()
+        exe = cmdline.replace("\\", "/").rsplit("/", 1)[-1].lower()
+        if len(fields) > 1 and int(fields[1]) == parent_pid and exe == name:
+            return int(entry.name)
+    return None
+
+
+def process_running(pid: int) -> bool:
+    if sys.platform == "win32":
+        import ctypes
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        handle = kernel32.OpenProcess(_SYNCHRONIZE, False, pid)
+        if not handle:
+            return False
+        try:
+            return kernel32.WaitForSingleObject(handle, 0) == _WAIT_TIMEOUT
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+_FICLONE = 0x40049409
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(max(0, seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
+
+
+@dataclass(frozen=True)
+class MoveProgress:
+    done_bytes: int
+    total_bytes: int
+    rate: float
+    eta: float | None
+
+
+class MoveJournal:
+    """Append-only list of files already copied and verified by a move.
+
+    Each line is a JSON object; a torn last line from a crash is ignored.
+    Lines with an ``offset`` mark a paused file whose ``.part`` copy holds
+    that many bytes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _entries(self):
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        entry = json.loads(line)
+                        yield entry["path"], int(entry["size"]), int(entry["mtime_ns"]), entry.get("offset")
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        continue
+        except OSError:
+            pass
+
+    def load(self) -> dict[str, tuple[int, int]]:
+        return {rel: (size, mtime_ns) for rel, size, mtime_ns, offset in self._entries() if offset is None}
+
+    def partial(self) -> dict[str, tuple[int, int, int]]:
+        paused: dict[str, tuple[int, int, int]] = {}
+        for rel, size, mtime_ns, offset in self._entries():
+            if offset is not None:
+                paused[rel] = (size, mtime_ns, int(offset))
+        return paused
+
+    def record(self, rel: str, size: int, mtime_ns: int, offset: int | None = None) -> None:
+        entry: dict[str, Any] = {"path": rel, "size": size, "mtime_ns": mtime_ns}
+        if offset is not None:
+            entry["offset"] = offset
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(line)
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    def remove(self) -> None:
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
+def _try_reflink(src, dst) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import fcntl
+
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except (ImportError, OSError):
+        return False
+
+
+def _hash_file(path: Path, buffer: bytearray) -> bytes:
+    digest = hashlib.blake2b()
+    view = memoryview(buffer)
+    with open(path, "rb") as handle:
+        while True:
+            read = handle.readinto(buffer)
+            if not read:
+                return digest.digest()
+            digest.update(view[:read])
+
+
+def copy_file_verified(
+    src: Path,
+    dst: Path,
+    *,
+    verify: bool = True,
+    cancel: threading.Event | None = None,
+    on_bytes: Callable[[int], None] | None = None,
+    buffer_size: int = MOVE_BUFFER_SIZE,
+    offset: int = 0,
+    on_pause: Callable[[int], None] | None = None,
+) -> bool:
+    """Copies ``src`` to ``dst`` through a ``.part`` file; returns False if cancelled.
+
+    With ``on_pause`` a cancelled copy keeps its ``.part`` file and reports how
+    many bytes it holds; passing that back as ``offset`` continues from there.
+    """
+    tmp = dst.with_name(dst.name + ".part")
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    digest = hashlib.blake2b() if verify else None
+    resume = offset > 0 and tmp.is_file() and tmp.stat().st_size >= offset
+    keep = False
+    try:
+        with open(src, "rb") as fin, open(tmp, "r+b" if resume else "wb") as fout:
+            if not resume and _try_reflink(fin, fout):
+                # A clone shares the source extents, so there is nothing to verify.
+                digest = None
+                if on_bytes:
+                    on_bytes(os.fstat(fin.fileno()).st_size)
+            else:
+                size = os.fstat(fin.fileno()).st_size
+                written = 0
+                if resume:
+                    # The digest covers the source prefix, so a damaged .part still fails verification.
+                    while written < offset:
+                        read = fin.readinto(view[:min(len(buffer), offset - written)])
+                        if not read:
+                            break
+                        if digest is not None:
+                            digest.update(view[:read])
+                        written += read
+                    fout.seek(written)
+                elif size:
+                    fout.truncate(size)
+                while True:
+                    if cancel is not None and cancel.is_set():
+                        break
+                    read = fin.readinto(buffer)
+                    if not read:
+                        break
+                    fout.write(view[:read])
+                    if digest is not None:
+                        digest.update(view[:read])
+                    written += read
+                    if on_bytes:
+                        on_bytes(read)
+                if cancel is not None and cancel.is_set():
+                    if on_pause is not None:
+                        fout.flush()
+                        os.fsync(fout.fileno())
+                        on_pause(written)
+                        keep = True
+                    raise InterruptedError
+                if written != size:
+                    fout.truncate(written)
+        shutil.copystat(src, tmp)
+        if digest is not None and _hash_file(tmp, buffer) != digest.digest():
+            raise OSError(f"Verification failed for {dst}")
+        os.replace(tmp, dst)
+        return True
+    except InterruptedError:
+        return False
+    finally:
+        if not keep:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+def is_inside(path: Path, root: Path) -> bool:
+    """True if ``path`` is ``root`` or below it, after resolving links and case."""
+    target = os.path.normcase(str(path.resolve()))
+    base = os.path.normcase(str(root.resolve()))
+    return target == base or target.startswith(base.rstrip(os.sep) + os.sep)
+
+
+def discard_partial_move(src: Path, dest: Path) -> int:
+    """Deletes what an unfinished move copied into ``dest``; returns the files removed.
+
+    Only files listed in the move journal and ``.part`` files of source files
+    are touched, plus directories left empty by that, so anything else in
+    ``dest`` survives.
+    """
+    journal = MoveJournal(dest / MOVE_JOURNAL_NAME)
+    copied = journal.load()
+    names = set(copied) | set(journal.partial())
+    for root, _, files in os.walk(src):
+        rel_root = Path(root).relative_to(src)
+        names.update((rel_root / name).as_posix() for name in files)
+    removed = 0
+    for rel in names:
+        target = dest / rel
+        # Copied files only count when the journal lists them; a same-named file may be the user's.
+        candidates = [target.with_name(target.name + ".part")]
+        if rel in copied:
+            candidates.append(target)
+        for path in candidates:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+    journal.remove()
+    for root, _, _ in sorted(os.walk(dest), key=lambda item: len(item[0]), reverse=True):
+        try:
+            os.rmdir(root)
+        except OSError:
+            pass
+    return removed
+
+
+def _same_volume(src: Path, dest_parent: Path) -> bool:
+    try:
+        return os.stat(src).st_dev == os.stat(dest_parent).st_dev
+    except OSError:
+        return False
+
+
+def move_installation(
+    src: Path,
+    dest: Path,
+    *,
+    workers: int = MOVE_COPY_WORKERS,
+    verify: bool = True,
+    cancel: threading.Event | None = None,
+    on_progress: Callable[[MoveProgress], None] | None = None,
+) -> bool:
+    """Moves the game from ``src`` to ``dest``; returns False if cancelled.
+
+    A same-volume move is a single rename. Otherwise files are copied in
+    parallel and recorded in a journal inside ``dest``, so running the same
+    move again resumes after the last verified file, and a file that was
+    only partly copied continues from its ``.part`` offset. ``src`` is left in
+    place for the caller to delete once the new location is saved.
+    """
+    if not dest.exists() and _same_volume(src, dest.parent):
+        try:
+            os.rename(src, dest)
+            return True
+        except OSError:
+            pass
+    dest.mkdir(parents=True, exist_ok=True)
+    journal = MoveJournal(dest / MOVE_JOURNAL_NAME)
+    done = journal.load()
+    paused = journal.partial()
+    files: list[tuple[str, int, int]] = []
+    for root, dirs, names in os.walk(src):
+        rel_root = Path(root).relative_to(src)
+        for name in dirs:
+            (dest / rel_root / name).mkdir(parents=True, exist_ok=True)
+        for name in names:
+            stat = os.stat(Path(root) / name)
+            files.append(((rel_root / name).as_posix(), stat.st_size, stat.st_mtime_ns))
+    total = sum(size for _, size, _ in files)
+    pending: list[tuple[str, int, int, int]] = []
+    completed = 0
+    for rel, size, mtime_ns in files:
+        target = dest / rel
+        if done.get(rel) == (size, mtime_ns) and target.is_file() and target.stat().st_size == size:
+            completed += size
+            continue
+        entry = paused.get(rel)
+        offset = entry[2] if entry is not None and entry[:2] == (size, mtime_ns) else 0
+        part = target.with_name(target.name + ".part")
+        if offset and not (part.is_file() and part.stat().st_size >= offset):
+            offset = 0
+        completed += offset
+        pending.append((rel, size, mtime_ns, offset))
+    # Biggest files first keeps every worker busy until the end of the move.
+    pending.sort(key=lambda item: item[1], reverse=True)
+
+    lock = threading.Lock()
+    started = time.monotonic()
+    resumed = completed
+    last_report = 0.0
+
+    def add_bytes(count: int) -> None:
+        nonlocal completed, last_report
+        with lock:
+            completed += count
+            now = time.monotonic()
+            if on_progress is None or now - last_report < MOVE_PROGRESS_INTERVAL:
+                return
+            last_report = now
+            rate = (completed - resumed) / max(now - started, 1e-6)
+            eta = (total - completed) / rate if rate > 0 else None
+            snapshot = MoveProgress(completed, total, rate, eta)
+        on_progress(snapshot)
+
+    def copy_one(item: tuple[str, int, int, int]) -> bool:
+        rel, size, mtime_ns, offset = item
+        if cancel is not None and cancel.is_set():
+            return False
+        copied = copy_file_verified(
+            src / rel,
+            dest / rel,
+            verify=verify,
+            cancel=cancel,
+            on_bytes=add_bytes,
+            offset=offset,
+            on_pause=lambda written: journal.record(rel, size, mtime_ns, offset=written),
+        )
+        if copied:
+            journal.record(rel, size, mtime_ns)
+        return copied
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="launcher-move") as pool:
+        results = list(pool.map(copy_one, pending))
+    if not all(results):
+        return False
+    if on_progress is not None:
+        rate = (total - resumed) / max(time.monotonic() - started, 1e-6)
+        on_progress(MoveProgress(total, total, rate, 0.0))
+    journal.remove()
+    return True
+
+
+@dataclass(frozen=True)
+class ModInfo:
+    name: str
+    files: tuple[str, ...]
+    size: int
+    enabled: bool
+
+
+def link_file(src: Path, dst: Path) -> str:
+    """Places ``src`` at ``dst`` without copying data when the filesystem allows it.
+
+    Returns the method used: ``hardlink``, ``reflink``, ``symlink`` or ``copy``.
+    """
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        pass
+    try:
+        with open(src, "rb") as fin, open(dst, "wb") as fout:
+            cloned = _try_reflink(fin, fout)
+        if cloned:
+            return "reflink"
+        dst.unlink()
+    except OSError:
+        try:
+            dst.unlink()
+        except OSError:
+            pass
+    try:
+        os.symlink(src, dst)
+        return "symlink"
+    except OSError:
+        pass
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+def _move_file(src: Path, dst: Path) -> None:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(str(src), str(dst))
+
+
+def _mod_files(mod_dir: Path) -> list[str]:
+    return sorted(
+        path.relative_to(mod_dir).as_posix()
+        for path in mod_dir.rglob("*")
+        if path.is_file() or path.is_symlink()
+    )
+
+
+def import_mod(source: Path, store: Path = MOD_STORE_DIR) -> str:
+    """Adds a mod folder or a single pak file to the store and returns its name.
+
+    Paths inside a folder are kept relative to the game directory; loose pak
+    files at its top level go to the game's ``~mods`` folder.
+    """
+    name = source.stem if source.is_file() else source.name
+    target = store / name
+    if target.exists():
+        raise FileExistsError(f"Mod '{name}' already exists")
+    if source.is_file():
+        entries = [(source, f"{MOD_PAK_DIR}/{source.name}")]
+    else:
+        entries = []
+        for rel in _mod_files(source):
+            if "/" not in rel and rel.lower().endswith(MOD_PAK_SUFFIXES):
+                entries.append((source / rel, f"{MOD_PAK_DIR}/{rel}"))
+            else:
+                entries.append((source / rel, rel))
+    staging = store / f".{name}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    try:
+        for src, rel in entries:
+            dst = staging / rel
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(src, dst)
+            except OSError:
+                shutil.copy2(src, dst)
+        os.replace(staging, target)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return name
+
+
+class ModManager:
+    """Enables mods from the store by linking their files into ``game_dir``.
+
+    The manifest records, per game directory, which mod owns each linked
+    file, how it was placed and where a replaced game file was moved, so
+    mods can be turned off or rolled back without copying anything.
+    """
+
+    def __init__(
+        self,
+        game_dir: Path,
+        store: Path = MOD_STORE_DIR,
+        backup_dir: Path = MOD_BACKUP_DIR,
+        manifest_path: Path = MOD_MANIFEST_FILE,
+    ):
+        self.game_dir = game_dir
+        self.store = store
+        self.backup_dir = backup_dir
+        self.manifest_path = manifest_path
+        self._lock = threading.Lock()
+
+    def _load_manifest(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest: dict[str, Any]) -> None:
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.manifest_path)
+
+    def _enabled(self, manifest: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        return manifest.setdefault(str(self.game_dir), {}).setdefault("mods", {})
+
+    def _backup_path(self, name: str, rel: str) -> Path:
+        # Keyed by game directory so two installations never share a backup slot.
+        key = hashlib.sha1(str(self.game_dir).encode("utf-8")).hexdigest()[:16]
+        return self.backup_dir / key / name / rel
+
+    def enabled_mods(self) -> list[str]:
+        return list(self._enabled(self._load_manifest()))
+
+    def list_mods(self) -> list[ModInfo]:
+        enabled = self._enabled(self._load_manifest())
+        mods = []
+        if self.store.is_dir():
+            for mod_dir in sorted(self.store.iterdir(), key=lambda path: path.name.lower()):
+                if not mod_dir.is_dir() or mod_dir.name.startswith("."):
+                    continue
+                files = _mod_files(mod_dir)
+                size = sum((mod_dir / rel).stat().st_size for rel in files)
+                mods.append(ModInfo(mod_dir.name, tuple(files), size, mod_dir.name in enabled))
+        return mods
+
+    def conflicts(self, name: str) -> dict[str, str]:
+        """Maps each file of ``name`` that another enabled mod owns to that mod."""
+        enabled = self._enabled(self._load_manifest())
+        owners = {rel: owner for owner, record in enabled.items() if owner != name for rel in record["files"]}
+        return {rel: owners[rel] for rel in _mod_files(self.store / name) if rel in owners}
+
+    def enable(self, name: str) -> dict[str, str]:
+        """Links a mod into the game; returns conflicts instead if there are any."""
+        with self._lock:
+            manifest = self._load_manifest()
+            enabled = self._enabled(manifest)
+            if name in enabled:
+                return {}
+            conflicts = self.conflicts(name)
+            if conflicts:
+                return conflicts
+            mod_dir = self.store / name
+            if not mod_dir.is_dir():
+                raise FileNotFoundError(mod_dir)
+            files: dict[str, dict[str, Any]] = {}
+            try:
+                for rel in _mod_files(mod_dir):
+                    dst = self.game_dir / rel
+                    dst.parent.mkdir(parents=True, exist_ok=True)
+                    backup = None
+                    if dst.exists() or dst.is_symlink():
+                        backup = self._backup_path(name, rel)
+                        if backup.exists() or backup.is_symlink():
+                            # Left over from an interrupted run; it may be the only copy of the original.
+                            raise FileExistsError(f"Mod backup already exists: {backup}")
+                        _move_file(dst, backup)
+                    # Recorded before linking so a failure below still restores the backup.
+                    files[rel] = {"method": None, "backup": str(backup) if backup else None}
+                    files[rel]["method"] = link_file(mod_dir / rel, dst)
+                    stat = dst.lstat()
+                    files[rel].update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            except BaseException:
+                self._unlink(name, files)
+                raise
+            enabled[name] = {"files": files}
+            self._save_manifest(manifest)
+            return {}
+
+    def disable(self, name: str) -> list[str]:
+        """Removes a mod's links and restores the files it replaced.
+
+        Returns the files that were changed since enabling (for example by a
+        game update); those are left in place.
+        """
+        with self._lock:
+            manifest = self._load_manifest()
+            record = self._enabled(manifest).pop(name, None)
+            if record is None:
+                return []
+            kept = self._unlink(name, record["files"])
+            self._save_manifest(manifest)
+            return kept
+
+    def rollback(self) -> list[str]:
+        """Disables every enabled mod, newest first, leaving the game as it was."""
+        kept: list[str] = []
+        for name in reversed(list(self._enabled(self._load_manifest()))):
+            kept += self.disable(name)
+        return kept
+
+    def _owned(self, name: str, rel: str, entry: dict[str, Any]) -> bool:
+        dst = self.game_dir / rel
+        source = self.store / name / rel
+        try:
+            if entry.get("method") == "symlink":
+                return dst.is_symlink() and Path(os.readlink(dst)) == source
+            if entry.get("method") == "hardlink":
+                return os.path.samefile(dst, source)
+            stat = dst.lstat()
+            return stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns")
+        except OSError:
+            return False
+
+    @staticmethod
+    def _set_aside(backup: str | None) -> None:
+        # The kept file replaced this original (for example through a game update), so
+        # it is renamed out of the backup slot instead of blocking the next enable.
+        if not backup or not Path(backup).exists():
+            return
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        aside = Path(f"{backup}.{stamp}.old")
+        suffix = 1
+        while aside.exists():
+            suffix += 1
+            aside = Path(f"{backup}.{stamp}-{suffix}.old")
+        _move_file(Path(backup), aside)
+
+    def _unlink(self, name: str, files: Mapping[str, dict[str, Any]]) -> list[str]:
+        kept = []
+        for rel, entry in reversed(list(files.items())):
+            dst = self.game_dir / rel
+            if entry.get("method") is not None:
+                if not self._owned(name, rel, entry):
+                    kept.append(rel)
+                    self._set_aside(entry.get("backup"))
+                    continue
+                dst.unlink()
+            backup = entry.get("backup")
+            if backup and Path(backup).exists():
+                _move_file(Path(backup), dst)
+        return kept
+
+
+@dataclass(frozen=True)
+class GalleryImage:
+    path: str
+    mtime_ns: int
+    size: int
+    thumbnail: str = ""
+
+
+def thumbnail_cache_path(path: str, mtime_ns: int, size: int, cache_dir: Path = THUMBNAIL_CACHE_DIR) -> Path:
+    key = hashlib.sha1(f"{path}|{mtime_ns}|{size}".encode("utf-8")).hexdigest()
+    return cache_dir / f"{key}.jpg"
+
+
+def keep_background_copy(src: Path, history_dir: Path = BACKGROUND_HISTORY_DIR) -> Path:
+    """Copies a picked background into the history, named after its content.
+
+    Different pictures that share a file name each get their own copy, and
+    picking the same picture twice reuses the first one.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    with open(src, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    kept = history_dir / f"{src.stem}-{digest.hexdigest()}{src.suffix.lower()}"
+    if not kept.exists():
+        history_dir.mkdir(parents=True, exist_ok=True)
+        tmp = kept.with_name(kept.name + ".tmp")
+        shutil.copy2(src, tmp)
+        os.replace(tmp, kept)
+    return kept
+
+
+def gallery_dirs(game_dir: Path | None) -> list[Path]:
+    dirs = [game_dir / sub for sub in GAME_SCREENSHOT_DIRS] if game_dir else []
+    return dirs + [BACKGROUND_HISTORY_DIR]
+
+
+def list_gallery_images(dirs: Sequence[Path], cache_dir: Path = THUMBNAIL_CACHE_DIR) -> list[GalleryImage]:
+    """Lists images under ``dirs``, newest first, with any cached thumbnail.
+
+    Cached thumbnails are touched so pruning evicts the least recently shown.
+    """
+    images = []
+    for base in dirs:
+        for root, _, names in os.walk(base):
+            for name in names:
+                if not name.lower().endswith(GALLERY_SUFFIXES):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if PILImage is None:
+                    thumbnail = path
+                else:
+                    cached = thumbnail_cache_path(path, stat.st_mtime_ns, stat.st_size, cache_dir)
+                    try:
+                        os.utime(cached)
+                        thumbnail = str(cached)
+                    except OSError:
+                        thumbnail = ""
+                images.append(GalleryImage(path, stat.st_mtime_ns, stat.st_size, thumbnail))
+    images.sort(key=lambda image: image.mtime_ns, reverse=True)
+    return images
+
+
+def make_thumbnails(
+    jobs: Sequence[tuple[str, str]],
+    size: tuple[int, int] = THUMBNAIL_SIZE,
+    quality: int = THUMBNAIL_QUALITY,
+) -> list[str]:
+    """Writes a JPEG thumbnail for each ``(source, target)`` pair.
+
+    Runs in a worker process; returns the sources that succeeded.
+    """
+    done = []
+    for source, target in jobs:
+        try:
+            with PILImage.open(source) as image:
+                # draft() lets the JPEG decoder downscale while decoding.
+                image.draft("RGB", (size[0] * 2, size[1] * 2))
+                image.thumbnail(size)
+                thumb = image.convert("RGB")
+            target_path = Path(target)
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target_path.with_suffix(".tmp")
+            thumb.save(tmp, "JPEG", quality=quality, optimize=True)
+            os.replace(tmp, target_path)
+            done.append(source)
+        except Exception:
+            continue
+    return done
+
+
+def prune_thumbnail_cache(cache_dir: Path = THUMBNAIL_CACHE_DIR, max_bytes: int = THUMBNAIL_CACHE_MAX_BYTES) -> int:
+    try:
+        entries = [(entry.stat().st_mtime_ns, entry.stat().st_size, entry.path) for entry in os.scandir(cache_dir)]
+    except OSError:
+        return 0
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+@dataclass(frozen=True)
+class SnapshotInfo:
+    id: str
+    created: float
+    label: str
+    files: int
+    size: int
+    new_bytes: int
+    game_dir: str = ""
+
+
+def select_snapshots_to_keep(
+    snapshots: Sequence[SnapshotInfo],
+    keep_last: int = 0,
+    keep_daily: int = 0,
+    keep_weekly: int = 0,
+) -> set[str]:
+    """Applies the retention policy: the newest ``keep_last`` snapshots plus
+    the newest snapshot of each of the last ``keep_daily`` days and
+    ``keep_weekly`` ISO weeks that have one."""
+    ordered = sorted(snapshots, key=lambda info: info.created, reverse=True)
+    keep = {info.id for info in ordered[:keep_last]}
+    for count, pattern in ((keep_daily, "%Y-%m-%d"), (keep_weekly, "%G-%V")):
+        buckets: set[str] = set()
+        for info in ordered:
+            if len(buckets) >= count:
+                break
+            bucket = time.strftime(pattern, time.localtime(info.created))
+            if bucket not in buckets:
+                buckets.add(bucket)
+                keep.add(info.id)
+    return keep
+
+
+def _is_sqlite_sidecar(name: str) -> bool:
+    return name.endswith(SNAPSHOT_SQLITE_SIDECARS)
+
+
+class SnapshotStore:
+    """Deduplicated snapshots of the game's config and local data.
+
+    Files are split into fixed-size chunks stored once under ``objects/``,
+    zlib-compressed and named by their BLAKE2b hash. A snapshot is a JSON
+    manifest listing each file's chunks, so unchanged files cost nothing
+    and restoring only rewrites files whose chunks differ.
+    """
+
+    def __init__(self, root: Path = SNAPSHOT_DIR):
+        self.root = root
+        self.objects = root / "objects"
+        self.manifests = root / "manifests"
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest
+
+    def _put_chunk(self, data: bytes | memoryview) -> tuple[str, int]:
+        digest = hashlib.blake2b(data, digest_size=20).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            return digest, 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        packed = zlib.compress(data, SNAPSHOT_COMPRESSION_LEVEL)
+        tmp = path.with_name(f"{digest}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(packed)
+        os.replace(tmp, path)
+        return digest, len(packed)
+
+    def _read_chunk(self, digest: str) -> bytes:
+        return zlib.decompress(self._object_path(digest).read_bytes())
+
+    def _chunk_file(self, path: Path, store: bool) -> tuple[list[str], int]:
+        chunks: list[str] = []
+        stored = 0
+        with open(path, "rb") as handle:
+            while True:
+                data = handle.read(SNAPSHOT_CHUNK_SIZE)
+                if not data:
+                    break
+                if store:
+                    digest, added = self._put_chunk(data)
+                    stored += added
+                else:
+                    digest = hashlib.blake2b(data, digest_size=20).hexdigest()
+                chunks.append(digest)
+        return chunks, stored
+
+    def load(self, snapshot_id: str) -> dict[str, Any]:
+        return json.loads((self.manifests / f"{snapshot_id}.json").read_text(encoding="utf-8"))
+
+    def rekey(self, old_dir: Path, new_dir: Path) -> int:
+        """Points snapshots of ``old_dir`` at ``new_dir`` after the game was moved."""
+        with self._lock:
+            moved = 0
+            for info in self.list_snapshots(old_dir):
+                target = self.manifests / f"{info.id}.json"
+                manifest = self.load(info.id)
+                manifest["game_dir"] = str(new_dir)
+                tmp = target.with_suffix(".tmp")
+                tmp.write_text(json.dumps(manifest, separators=(",", ":")), encoding="utf-8")
+                os.replace(tmp, target)
+                moved += 1
+            return moved
+
+    def list_snapshots(self, game_dir: Path | None = None) -> list[SnapshotInfo]:
+        """Lists snapshots newest first, only those of ``game_dir`` when given."""
+        infos = []
+        if self.manifests.is_dir():
+            for path in self.manifests.glob("*.json"):
+                try:
+                    manifest = json.loads(path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    continue
+                if game_dir is not None and manifest.get("game_dir") != str(game_dir):
+                    continue
+                files = manifest.get("files", {})
+                infos.append(
+                    SnapshotInfo(
+                        id=path.stem,
+                        created=float(manifest.get("created", 0)),
+                        label=manifest.get("label", ""),
+                        files=len(files),
+                        size=sum(entry["size"] for entry in files.values()),
+                        new_bytes=int(manifest.get("new_bytes", 0)),
+                        game_dir=manifest.get("game_dir", ""),
+                    )
+                )
+        return sorted(infos, key=lambda info: info.created, reverse=True)
+
+    def create(
+        self,
+        game_dir: Path,
+        label: str = "",
+        sources: Sequence[Path] = SNAPSHOT_SOURCES,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> SnapshotInfo:
+        with self._lock:
+            previous: dict[str, Any] = {}
+            latest = self.list_snapshots(game_dir)
+            if latest:
+                try:
+                    previous = self.load(latest[0].id).get("files", {})
+                except (OSError, ValueError):
+                    previous = {}
+            paths: list[tuple[str, Path]] = []
+            for source in sources:
+                for root, _, names in os.walk(game_dir / source):
+                    for name in names:
+                        if not _is_sqlite_sidecar(name):
+                            path = Path(root) / name
+                            paths.append((path.relative_to(game_dir).as_posix(), path))
+            files: dict[str, dict[str, Any]] = {}
+            new_bytes = 0
+            scratch = self.root / "tmp"
+            for index, (rel, path) in enumerate(paths):
+                stat = path.stat()
+                known = previous.get(rel)
+                is_database = path.suffix == ".db"
+                if (
+                    not is_database
+                    and known
+                    and known["size"] == stat.st_size
+                    and known["mtime_ns"] == stat.st_mtime_ns
+                ):
+                    # Unchanged since the last snapshot: reuse its chunk list without reading the file.
+                    files[rel] = known
+                elif is_database:
+                    # Live databases are copied through the backup API first so the
+                    # snapshot also includes pages still sitting in the WAL file.
+                    scratch.mkdir(parents=True, exist_ok=True)
+                    copy_path = scratch / f"{threading.get_ident()}.db"
+                    try:
+                        _copy_database(path, copy_path)
+                        chunks, stored = self._chunk_file(copy_path, store=True)
+                        size = copy_path.stat().st_size
+                    finally:
+                        try:
+                            copy_path.unlink()
+                        except OSError:
+                            pass
+                    files[rel] = {"size": size, "mtime_ns": stat.st_mtime_ns, "chunks": chunks}
+                    new_bytes += stored
+                else:
+                    chunks, stored = self._chunk_file(path, store=True)
+                    files[rel] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "chunks": chunks}
+                    new_bytes += stored
+                if on_progress:
+                    on_progress(index + 1, len(paths))
+            created = time.time()
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(created))
+            snapshot_id = stamp
+            suffix = 1
+            while (self.manifests / f"{snapshot_id}.json").exists():
+                suffix += 1
+                snapshot_id = f"{stamp}-{suffix}"
+            manifest = {
+                "version": 1,
+                "created": created,
+                "label": label,
+                "game_dir": str(game_dir),
+                "sources": [source.as_posix() for source in sources],
+                "new_bytes": new_bytes,
+                "files": files,
+            }
+            self.manifests.mkdir(parents=True, exist_ok=True)
+            target = self.manifests / f"{snapshot_id}.json"
+            tmp = target.with_suffix(".tmp")
+            tmp.write_text(json.dumps(manifest, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, target)
+            return SnapshotInfo(
+                snapshot_id,
+                created,
+                label,
+                len(files),
+                sum(entry["size"] for entry in files.values()),
+                new_bytes,
+                str(game_dir),
+            )
+
+    def restore(
+        self,
+        snapshot_id: str,
+        game_dir: Path,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> tuple[int, int]:
+        """Makes the snapshotted folders match the snapshot again.
+
+        Files whose size and mtime, or failing that chunk hashes, already
+        match are left alone. Returns the number of files written and removed.
+        """
+        with self._lock:
+            manifest = self.load(snapshot_id)
+            if manifest.get("game_dir") not in (None, str(game_dir)):
+                raise ValueError(f"Snapshot {snapshot_id} was taken from {manifest['game_dir']}")
+            files: dict[str, dict[str, Any]] = manifest["files"]
+            written = removed = 0
+            for index, (rel, entry) in enumerate(files.items()):
+                dst = game_dir / rel
+                if not self._matches(dst, entry):
+                    dst.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = dst.with_name(dst.name + ".restore")
+                    with open(tmp, "wb") as handle:
+                        for digest in entry["chunks"]:
+                            handle.write(self._read_chunk(digest))
+                    os.utime(tmp, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+                    if dst.suffix == ".db":
+                        for sidecar in SNAPSHOT_SQLITE_SIDECARS:
+                            try:
+                                dst.with_name(dst.name + sidecar).unlink()
+                            except OSError:
+                                pass
+                    os.replace(tmp, dst)
+                    written += 1
+                if on_progress:
+                    on_progress(index + 1, len(files))
+            for source in manifest.get("sources", ()):
+                for root, _, names in os.walk(game_dir / source):
+                    for name in names:
+                        path = Path(root) / name
+                        rel = path.relative_to(game_dir).as_posix()
+                        if rel not in files and not _is_sqlite_sidecar(name):
+                            path.unlink()
+                            removed += 1
+            return written, removed
+
+    def _matches(self, path: Path, entry: Mapping[str, Any]) -> bool:
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        is_database = path.suffix == ".db"
+        if is_database:
+            # Pending WAL pages mean the live database differs from its file.
+            wal = path.with_name(path.name + "-wal")
+            if wal.exists() and wal.stat().st_size:
+                return False
+        if stat.st_size != entry["size"]:
+            return False
+        # A database's mtime can stay put while its WAL changes, so it is always hashed.
+        if stat.st_mtime_ns == entry["mtime_ns"] and not is_database:
+            return True
+        chunks, _ = self._chunk_file(path, store=False)
+        if chunks != entry["chunks"]:
+            return False
+        os.utime(path, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+        return True
+
+    def prune(self, retention: Mapping[str, int] = DEFAULT_SNAPSHOT_RETENTION) -> tuple[int, int]:
+        """Deletes snapshots outside the retention policy and their unused chunks.
+
+        Returns the number of snapshots and chunk objects removed.
+        """
+        with self._lock:
+            snapshots = self.list_snapshots()
+            # Retention applies per game directory, so one install never pushes out another's history.
+            keep: set[str] = set()
+            for game_dir in {info.game_dir for info in snapshots}:
+                keep |= select_snapshots_to_keep(
+                    [info for info in snapshots if info.game_dir == game_dir],
+                    keep_last=int(retention.get("keep_last", 0)),
+                    keep_daily=int(retention.get("keep_daily", 0)),
+                    keep_weekly=int(retention.get("keep_weekly", 0)),
+                )
+            dropped = 0
+            for info in snapshots:
+                if info.id not in keep:
+                    (self.manifests / f"{info.id}.json").unlink()
+                    dropped += 1
+            referenced: set[str] = set()
+            for info in snapshots:
+                if info.id in keep:
+                    for entry in self.load(info.id)["files"].values():
+                        referenced.update(entry["chunks"])
+            collected = 0
+            if self.objects.is_dir():
+                for path in self.objects.glob("*/*"):
+                    if path.name not in referenced:
+                        path.unlink()
+                        collected += 1
+            return dropped, collected
+
+
+class HoverBehavior:
+    """Mixin that toggles a boolean when the pointer enters or leaves the widget."""
+
+    hovered = BooleanProperty(False)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.register_event_type("on_enter")
+        self.register_event_type("on_leave")
+        Window.bind(mouse_pos=self._on_mouse_pos)
+
+    def _on_mouse_pos(self, window, pos):
+        if not self.get_root_window():
+            return
+        inside = self.collide_point(*self.to_widget(*pos))
+        if self.hovered == inside:
+            return
+        self.hovered = inside
+        if inside:
+            self.dispatch("on_enter")
+        else:
+            self.dispatch("on_leave")
+
+    def on_enter(self):  # pragma: no cover - hook for subclasses
+        pass
+
+    def on_leave(self):  # pragma: no cover - hook for subclasses
+        pass
+
+
+class SidebarButton(ButtonBehavior, BoxLayout):
+    sidebar = ObjectProperty(None, rebind=True)
+    icon_text = StringProperty("")
+    text_label = StringProperty("")
+    label_key = StringProperty("")
+    screen_name = StringProperty("home")
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation="horizontal", **kwargs)
+
+    def on_release(self):
+        if self.sidebar:
+            self.sidebar.select(self.screen_name)
+
+
+class Sidebar(HoverBehavior, BoxLayout):
+    expanded_width = NumericProperty(dp(220))
+    collapsed_width = NumericProperty(dp(72))
+    label_width = NumericProperty(0)
+    labels_opacity = NumericProperty(0)
+    active_screen = StringProperty("home")
+    show_labels = BooleanProperty(False)
+    menu_container = ObjectProperty(None)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.width = self.collapsed_width
+        self._callback: Callable[[str], None] | None = None
+        self._buttons: list[SidebarButton] = []
+
+    def on_kv_post(self, base_widget):
+        self.width = self.collapsed_width
+        self.label_width = 0
+        self.labels_opacity = 0
+        self.show_labels = False
+
+    def on_hovered(self, instance, value):
+        self.show_labels = bool(value)
+        target_width = self.expanded_width if value else self.collapsed_width
+        target_label_width = max(0, self.expanded_width - self.collapsed_width) if value else 0
+        target_opacity = 1 if value else 0
+        Animation.cancel_all(self, "width", "label_width", "labels_opacity")
+        Animation(
+            width=target_width,
+            label_width=target_label_width,
+            labels_opacity=target_opacity,
+            duration=0.25,
+            t="out_quad",
+        ).start(self)
+
+    def populate(self, entries: Sequence[MenuEntry], callback: Callable[[str], None]) -> None:
+        self._callback = callback
+        container = self.menu_container
+        if container is None:
+            return
+        container.clear_widgets()
+        self._buttons = []
+        app = App.get_running_app()
+        for entry in entries:
+            button = SidebarButton(
+                sidebar=self,
+                icon_text=entry.icon,
+                label_key=entry.label_key,
+                screen_name=entry.screen,
+            )
+            if app:
+                button.text_label = app.translate(entry.label_key)
+            else:
+                button.text_label = entry.label_key
+            container.add_widget(button)
+            self._buttons.append(button)
+        container.add_widget(Widget(size_hint_y=1))
+
+    def update_labels(self):
+        app = App.get_running_app()
+        if not app:
+            return
+        for button in self._buttons:
+            button.text_label = app.translate(button.label_key)
+
+    def select(self, screen_name: str, dispatch: bool = True) -> None:
+        self.active_screen = screen_name
+        if dispatch and self._callback:
+            self._callback(screen_name)
+
+
+class StorageView(BoxLayout):
+    status_text = StringProperty("")
+    summary_text = StringProperty("")
+
+    def show(self, summary: UsageSummary, finished: bool) -> None:
+        app = App.get_running_app()
+        translate = app.translate if app else (lambda key, **kwargs: key)
+        self.status_text = translate("storage.done" if finished else "storage.scanning")
+        lines = [
+            translate("storage.total", size=format_size(summary.total), files=summary.files),
+            "",
+            f"[b]{translate('storage.folders')}[/b]",
+        ]
+        for name, size in summary.folders:
+            label = translate("storage.root_files") if name == "." else name
+            lines.append(f"{format_size(size):>10}   {label}")
+        lines += ["", f"[b]{translate('storage.types')}[/b]"]
+        for ext, size in summary.extensions:
+            lines.append(f"{format_size(size):>10}   {ext or translate('storage.no_extension')}")
+        self.summary_text = "\n".join(lines)
+
+
+class PerformanceView(BoxLayout):
+    values_text = StringProperty("")
+    status_text = StringProperty("")
+    preset_values = ObjectProperty([])
+    preset_text = StringProperty("")
+
+    def show_values(self, values: Mapping[str, Any]) -> None:
+        app = App.get_running_app()
+        if not app:
+            return
+        if not values:
+            self.values_text = app.translate("performance.not_found")
+            return
+        lines = []
+        for name in GAME_SETTING_LOCATIONS:
+            value = values.get(name)
+            if isinstance(value, bool):
+                value = app.translate("performance.on" if value else "performance.off")
+            lines.append(f"{app.translate(f'performance.setting.{name}')}: {'-' if value is None else value}")
+        self.values_text = "\n".join(lines)
+
+
+class SnapshotsView(BoxLayout):
+    summary_text = StringProperty("")
+    status_text = StringProperty("")
+    snapshot_values = ObjectProperty([])
+    snapshot_text = StringProperty("")
+
+    def __init__(self, **kwargs):
+        self.lookup: dict[str, str] = {}
+        super().__init__(**kwargs)
+
+    def show(self, snapshots: Sequence[SnapshotInfo]) -> None:
+        app = App.get_running_app()
+        if not app:
+            return
+        self.lookup = {}
+        lines = []
+        for info in snapshots:
+            date = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(info.created))
+            label = f"  {app.translate(f'snapshots.label.{info.label}')}" if info.label else ""
+            self.lookup[f"{date}{label}"] = info.id
+            lines.append(
+                app.translate(
+                    "snapshots.line",
+                    date=date,
+                    files=info.files,
+                    size=format_size(info.size),
+                    new=format_size(info.new_bytes),
+                )
+                + label
+            )
+        self.summary_text = "\n".join(lines) or app.translate("snapshots.empty")
+        self.snapshot_values = list(self.lookup)
+        if self.snapshot_text not in self.lookup:
+            self.snapshot_text = self.snapshot_values[0] if self.snapshot_values else ""
+
+
+class TaskListView(BoxLayout):
+    summary_text = StringProperty("")
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._trigger = Clock.create_trigger(lambda dt: self.refresh(), 0.1)
+
+    def on_task_changed(self, task: BackgroundTask) -> None:
+        self._trigger()
+
+    def refresh(self) -> None:
+        app = App.get_running_app()
+        if not app:
+            return
+        lines = []
+        for task in app.tasks.active():
+            state = app.translate(f"tasks.state.{task.state}")
+            progress = f"{task.progress:4.0%}" if task.progress is not None else "    "
+            lines.append(f"{state:<10} {progress}  {app.translate(task.name)}")
+        self.summary_text = "\n".join(lines) or app.translate("tasks.empty")
+
+
+class MoveView(BoxLayout):
+    status_text = StringProperty("")
+    detail_text = StringProperty("")
+    progress = NumericProperty(0.0)
+
+    def show(self, progress: MoveProgress) -> None:
+        app = App.get_running_app()
+        translate = app.translate if app else (lambda key, **kwargs: key)
+        self.progress = progress.done_bytes / progress.total_bytes if progress.total_bytes else 1.0
+        eta = format_duration(progress.eta) if progress.eta is not None else "--:--"
+        self.detail_text = translate(
+            "move.progress",
+            done=format_size(progress.done_bytes),
+            total=format_size(progress.total_bytes),
+            rate=format_size(int(progress.rate)),
+            eta=eta,
+        )
+
+
+class MoveResumeView(BoxLayout):
+    status_text = StringProperty("")
+
+
+class ModRow(BoxLayout):
+    mod_name = StringProperty("")
+    detail = StringProperty("")
+    enabled = BooleanProperty(False)
+
+
+class ModsView(BoxLayout):
+    status_text = StringProperty("")
+
+    def show(self, mods: Sequence[ModInfo], on_toggle: Callable[[str, bool], None]) -> None:
+        app = App.get_running_app()
+        translate = app.translate if app else (lambda key, **kwargs: key)
+        container = self.ids.mod_list
+        container.clear_widgets()
+        for mod in mods:
+            row = ModRow(
+                mod_name=mod.name,
+                detail=translate("mods.detail", files=len(mod.files), size=format_size(mod.size)),
+                enabled=mod.enabled,
+            )
+            row.ids.check.bind(on_release=lambda check, name=mod.name: on_toggle(name, check.active))
+            container.add_widget(row)
+        if not mods:
+            self.status_text = translate("mods.empty", path=MOD_STORE_DIR)
+
+
+class GalleryTile(ButtonBehavior, BoxLayout):
+    path = StringProperty("")
+    thumbnail = StringProperty("")
+    title = StringProperty("")
+
+    def on_release(self):
+        app = App.get_running_app()
+        if app and self.path:
+            app.set_gallery_background(self.path)
+
+
+class NewsCard(ButtonBehavior, BoxLayout):
+    title = StringProperty("")
+    text = StringProperty("")
+    link = StringProperty("")
+    texture = ObjectProperty(None, allownone=True)
+
+    def on_release(self):
+        if self.link:
+            webbrowser.open(self.link)
+
+
+class LauncherRoot(FloatLayout):
+    sidebar = ObjectProperty(None)
+    content_manager = ObjectProperty(None)
+    game_dir = StringProperty("")
+    can_play = BooleanProperty(False)
+    moving = BooleanProperty(False)
+    status_text = StringProperty("Game directory: not set")
+    current_screen = StringProperty("home")
+    content_padding_left = NumericProperty(dp(16) + dp(72))
+    news_status_key = StringProperty("")
+    gallery_status_key = StringProperty("")
+
+    def __init__(self, **kwargs):
+        self._bg_rect = None
+        self._bg_color = None
+        self._background_source: str | None = None
+        self._background_key: tuple | None = None
+        self._background_task: BackgroundTask | None = None
+        self._probe_task: BackgroundTask | None = None
+        self._news_cards: dict[str, list[NewsCard]] = {}
+        self._gallery_index: dict[str, int] = {}
+        super().__init__(**kwargs)
+        self._ensure_background_canvas()
+
+    def on_kv_post(self, base_widget):
+        self.bind(can_play=self._sync_play_button, moving=self._sync_play_button, status_text=self._sync_status_label)
+        if self.sidebar:
+            self.sidebar.populate(MENU_ENTRIES, self.switch_to)
+            self.sidebar.select(self.current_screen, dispatch=False)
+            self.content_padding_left = dp(16) + self.sidebar.collapsed_width
         self.apply_translations()
 
     def refresh_state(self):
-        app = App.get_running_app()
         dir_path = Path(self.game_dir).expanduser() if self.game_dir else None
-        exe_path = dir_path / "Wuthering Waves.exe" if dir_path else None
-        exists = bool(dir_path and dir_path.exists() and exe_path and exe_path.exists())
-        self.can_play = exists
+        tasks = running_scheduler()
+        if tasks is None:
+            self._apply_game_dir_state(dir_path, *probe_game_dir(dir_path))
+            return
+        tasks.cancel(self._probe_task)
+
+        def done(task: BackgroundTask) -> None:
+            if task.state == TASK_DONE:
+                self._apply_game_dir_state(dir_path, *task.result)
+
+        self._probe_task = tasks.submit_io(
+            "task.check_game_dir",
+            lambda ctx: asyncio.to_thread(probe_game_dir, dir_path),
+            priority=TASK_PRIORITY_HIGH,
+            on_done=done,
+        )
+
+    def _apply_game_dir_state(self, dir_path: Path | None, dir_exists: bool, exe_exists: bool) -> None:
+        app = App.get_running_app()
+        self.can_play = dir_exists and exe_exists
         if app:
-            if dir_path and dir_path.exists():
+            if dir_exists:
                 self.status_text = app.translate("status.set", path=str(dir_path))
             else:
                 self.status_text = app.translate("status.not_set")
@@ -459,7 +3418,7 @@ class LauncherRoot(FloatLayout):
     def _sync_play_button(self, *_):
         button = self.ids.get("play_button")
         if button:
-            button.disabled = not self.can_play
+            button.disabled = not self.can_play or self.moving
 
     def _sync_status_label(self, *_):
         label = self.ids.get("status_label")
@@ -469,44 +3428,138 @@ class LauncherRoot(FloatLayout):
     def _sync_game_dir_value(self, *_):
         label = self.ids.get("game_dir_value")
         if label:
-            label.text = self.status_text
+            label.text = self.status_text
+
+    def _ensure_background_canvas(self):
+        if self._bg_rect is None or self._bg_color is None:
+            with self.canvas.before:
+                self._bg_color = Color(0.11, 0.11, 0.13, 1)
+                self._bg_rect = Rectangle(pos=self.pos, size=self.size)
+            self.bind(pos=self._update_background_rect, size=self._update_background_rect)
+
+    def _update_background_rect(self, *_):
+        if self._bg_rect is not None:
+            self._bg_rect.pos = self.pos
+            self._bg_rect.size = self.size
+
+    def update_background(self, path: str | Path | BundledAsset | None):
+        self._ensure_background_canvas()
+        key = None
+        source: Path | memoryview | None = None
+        if isinstance(path, BundledAsset):
+            key, source, name = ("bundle", path.name), path.data, path.name
+        elif path:
+            candidate = Path(path)
+            try:
+                stat = candidate.stat()
+                key, source, name = (str(candidate), stat.st_mtime_ns, stat.st_size), candidate, str(candidate)
+            except OSError:
+                key = None
+        if key is not None and key == self._background_key:
+            return
+        self._background_key = key
+        tasks = running_scheduler()
+        if tasks is not None:
+            tasks.cancel(self._background_task)
+            self._background_task = None
+        if source is None:
+            self._apply_background(None, None, "")
+            return
+        ext = Path(name).suffix.lstrip(".").lower()
+        if tasks is None:
+            try:
+                image = load_image_task(None, source)
+            except Exception:
+                image = None
+            self._apply_background(name, image, ext)
+            return
+
+        def done(task: BackgroundTask) -> None:
+            if task.state == TASK_CANCELLED:
+                return
+            self._apply_background(name, task.result if task.state == TASK_DONE else None, ext)
+
+        self._background_task = tasks.submit_cpu(
+            "task.decode_background",
+            load_image_task,
+            source,
+            priority=TASK_PRIORITY_HIGH,
+            on_done=done,
+        )
+
+    def _apply_background(self, source: str | None, image: DecodedImage | bytes | None, ext: str) -> None:
+        texture = None
+        if image is not None:
+            try:
+                texture = texture_from_image(image, ext)
+            except Exception:
+                texture = None
+        if texture is not None:
+            self._bg_rect.texture = texture
+            self._bg_color.rgba = (1, 1, 1, 1)
+        else:
+            source = None
+            self._bg_rect.texture = None
+            self._bg_color.rgba = (0.11, 0.11, 0.13, 1)
+        self._background_source = source
+
+    def show_news(self, items: Sequence[NewsItem]) -> None:
+        container = self.ids.get("news_list")
+        if container is None:
+            return
+        previous = {url: cards[0].texture for url, cards in self._news_cards.items() if cards}
+        container.clear_widgets()
+        self._news_cards = {}
+        for item in items:
+            card = NewsCard(title=item.title, text=item.text, link=item.link)
+            if item.image:
+                card.texture = previous.get(item.image)
+                self._news_cards.setdefault(item.image, []).append(card)
+            container.add_widget(card)
+
+    def set_news_image(self, url: str, texture) -> None:
+        for card in self._news_cards.get(url, ()):
+            card.texture = texture
+
+    def set_news_status(self, key: str) -> None:
+        self.news_status_key = key
+        label = self.ids.get("store_status")
+        app = App.get_running_app()
+        if label:
+            label.text = app.translate(key) if app and key else ""
 
-    def _ensure_background_canvas(self):
-        if self._bg_rect is None or self._bg_color is None:
-            with self.canvas.before:
-                self._bg_color = Color(0.11, 0.11, 0.13, 1)
-                self._bg_rect = Rectangle(pos=self.pos, size=self.size)
-            self.bind(pos=self._update_background_rect, size=self._update_background_rect)
+    def show_gallery(self, images: Sequence[GalleryImage]) -> None:
+        view = self.ids.get("gallery_view")
+        if view is None:
+            return
+        view.data = [{"path": image.path, "thumbnail": image.thumbnail, "title": Path(image.path).name} for image in images]
+        self._gallery_index = {image.path: index for index, image in enumerate(images)}
+        self.set_gallery_status("gallery.hint" if images else "gallery.empty")
 
-    def _update_background_rect(self, *_):
-        if self._bg_rect is not None:
-            self._bg_rect.pos = self.pos
-            self._bg_rect.size = self.size
+    def set_gallery_thumbnails(self, thumbnails: Mapping[str, str]) -> None:
+        view = self.ids.get("gallery_view")
+        if view is None:
+            return
+        for path, thumbnail in thumbnails.items():
+            index = self._gallery_index.get(path)
+            if index is not None:
+                view.data[index]["thumbnail"] = thumbnail
+        view.refresh_from_data()
 
-    def update_background(self, path: str | Path | None):
-        self._ensure_background_canvas()
-        source = None
-        if path:
-            candidate = Path(path) if not isinstance(path, Path) else path
-            if candidate.exists():
-                try:
-                    texture = CoreImage(str(candidate)).texture
-                    source = str(candidate)
-                    self._bg_rect.texture = texture
-                    self._bg_color.rgba = (1, 1, 1, 1)
-                except Exception:
-                    source = None
-        if not source and self._bg_rect is not None:
-            self._bg_rect.texture = None
-            if self._bg_color is not None:
-                self._bg_color.rgba = (0.11, 0.11, 0.13, 1)
-        self._background_source = source
+    def set_gallery_status(self, key: str) -> None:
+        self.gallery_status_key = key
+        label = self.ids.get("gallery_status")
+        app = App.get_running_app()
+        if label:
+            label.text = app.translate(key) if app and key else ""
 
     def apply_translations(self):
         app = App.get_running_app()
         if not app:
             return
         self.refresh_state()
+        self.set_news_status(self.news_status_key)
+        self.set_gallery_status(self.gallery_status_key)
         choose_btn = self.ids.get("choose_button")
         if choose_btn:
             choose_btn.text = app.translate("settings.select_folder")
@@ -522,6 +3575,31 @@ class LauncherRoot(FloatLayout):
         background_button = self.ids.get("background_button")
         if background_button:
             background_button.text = app.translate("settings.change_background")
+        storage_button = self.ids.get("storage_button")
+        if storage_button:
+            storage_button.text = app.translate("settings.storage")
+        performance_button = self.ids.get("performance_button")
+        if performance_button:
+            performance_button.text = app.translate("settings.performance")
+        mods_button = self.ids.get("mods_button")
+        if mods_button:
+            mods_button.text = app.translate("settings.mods")
+        snapshots_button = self.ids.get("snapshots_button")
+        if snapshots_button:
+            snapshots_button.text = app.translate("settings.snapshots")
+        move_button = self.ids.get("move_button")
+        if move_button:
+            move_button.text = app.translate("settings.move_install")
+        tasks_button = self.ids.get("tasks_button")
+        if tasks_button:
+            tasks_button.text = app.translate("settings.tasks")
+        launch_profile_label = self.ids.get("launch_profile_label")
+        if launch_profile_label:
+            launch_profile_label.text = app.translate("settings.launch_profile_label")
+        profile_spinner = self.ids.get("launch_profile_spinner")
+        if profile_spinner:
+            profile_spinner.values = sorted(load_launch_profiles(app.cfg))
+            profile_spinner.text = app.cfg.get("launch_profile") or DEFAULT_LAUNCH_PROFILE
         spinner = self.ids.get("language_spinner")
         if spinner:
             values = [app.language_display_for(code) for code in app.available_languages]
@@ -540,22 +3618,37 @@ class LauncherRoot(FloatLayout):
                 app.translate("popup.file_dialog.unsupported") if app else "Unsupported",
             )
             return
-        selected = app.open_directory_dialog() if app else ''
-        if selected:
-            app.on_file_chosen(selected, None)
+        app.open_directory_dialog(lambda selected: app.on_file_chosen(selected, None))
 
     def play(self):
         app = App.get_running_app()
+        if self.moving:
+            return
         if not self.can_play:
             info_popup(
                 app.translate("popup.no_game_file.title") if app else "Game File Missing",
                 app.translate("popup.no_game_file.message") if app else "Select the game directory first.",
             )
             return
+        preset = app.cfg.get("performance_preset") if app else ""
+        if app and preset in PERFORMANCE_PRESETS:
+            app.apply_performance_preset(preset, self._on_preset_applied)
+            return
+        self._launch_game()
+
+    def _on_preset_applied(self, task: BackgroundTask) -> None:
+        # A fresh install has no settings files yet, which is not worth blocking the launch for.
+        if task.state == TASK_DONE or isinstance(task.error, FileNotFoundError):
+            self._launch_game()
+
+    def _launch_game(self) -> None:
+        app = App.get_running_app()
         try:
             dir_path = Path(self.game_dir)
-            exe_path = dir_path / "Wuthering Waves.exe"
-            subprocess.Popen([str(exe_path)], cwd=str(dir_path))
+            exe_path = dir_path / GAME_EXE_NAME
+            process = subprocess.Popen([str(exe_path)], cwd=str(dir_path))
+            if app:
+                app.track_game_process(process)
         except Exception as exc:
             info_popup(
                 app.translate("popup.launch_error.title") if app else "Launch Error",
@@ -570,18 +3663,26 @@ class LauncherRoot(FloatLayout):
         self.current_screen = screen_name
         if self.sidebar and self.sidebar.active_screen != screen_name:
             self.sidebar.select(screen_name, dispatch=False)
+        app = App.get_running_app()
+        if screen_name == "gallery" and app:
+            app.load_gallery()
 class WuwaLauncherApp(App):
     title = APP_TITLE
     initial_dir = StringProperty("")
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.tasks = TaskScheduler()
+        self.snapshots = SnapshotStore()
+        self._config_lock = asyncio.Lock()
+        self._save_trigger = Clock.create_trigger(lambda dt: self.save_config_async(), CONFIG_SAVE_DELAY)
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         USER_DATA_DIR.mkdir(parents=True, exist_ok=True)
         USER_ASSETS_DIR.mkdir(parents=True, exist_ok=True)
         USER_LANG_DIR.mkdir(parents=True, exist_ok=True)
         UI_ASSETS_DIR.mkdir(parents=True, exist_ok=True)
-        self.cfg, needs_save = load_config()
+        self.bundle = get_asset_bundle()
+        self.cfg, needs_save = load_config(bundle=self.bundle)
         legacy_path = self.cfg.pop("game_path", None)
         converted = legacy_path is not None
         if legacy_path and "game_dir" not in self.cfg:
@@ -617,15 +3718,42 @@ class WuwaLauncherApp(App):
         if "window_position" not in self.cfg:
             self.cfg["window_position"] = [Window.left, Window.top]
             defaults_applied = True
+        if "performance_preset" not in self.cfg:
+            self.cfg["performance_preset"] = ""
+            defaults_applied = True
+        if not isinstance(self.cfg.get("launch_profiles"), dict):
+            self.cfg["launch_profiles"] = copy.deepcopy(DEFAULT_LAUNCH_PROFILES)
+            defaults_applied = True
+        if "launch_profile" not in self.cfg:
+            self.cfg["launch_profile"] = DEFAULT_LAUNCH_PROFILE
+            defaults_applied = True
+        self._launcher_state: ProcessState | None = None
+        self._game_task: BackgroundTask | None = None
+        if "news_feed_url" not in self.cfg:
+            self.cfg["news_feed_url"] = ""
+            defaults_applied = True
+        if not isinstance(self.cfg.get("snapshot_retention"), dict):
+            self.cfg["snapshot_retention"] = dict(DEFAULT_SNAPSHOT_RETENTION)
+            defaults_applied = True
+        self._news_cache: HttpCache | None = None
+        self._news_shown: set[str] = set()
+        self._gallery_tasks: list[BackgroundTask] = []
         if converted or needs_save or defaults_applied:
             try:
                 save_config(self.cfg)
             except Exception:
                 pass
 
+    def run(self):
+        asyncio.run(self.async_run(async_lib="asyncio"))
+
     def build(self):
+        self.tasks.start()
         Window.clearcolor = (0, 0, 0, 0)
-        if KV_FILE.exists():
+        bundled_kv = self.bundle.read_text("launcher.kv") if self.bundle else None
+        if bundled_kv is not None:
+            Builder.load_string(bundled_kv, filename=KV_FILE.name)
+        elif KV_FILE.exists():
             Builder.load_file(str(KV_FILE))
         else:
             Builder.load_string(KV_FALLBACK)
@@ -649,8 +3777,91 @@ class WuwaLauncherApp(App):
         root.apply_translations()
         root.switch_to("home")
         root.update_background(self.background_path())
+        self._start_news_feed(root)
         return root
 
+    def _start_news_feed(self, root: LauncherRoot) -> None:
+        url = self.cfg.get("news_feed_url") or ""
+        if not url:
+            root.set_news_status("store.no_feed")
+            return
+        root.set_news_status("store.loading")
+
+        def cached(task: BackgroundTask) -> None:
+            if task.state != TASK_DONE:
+                return
+            self._news_cache, items = task.result
+            if items:
+                self.root.show_news(items)
+                self.root.set_news_status("")
+                for item in items:
+                    if item.image:
+                        self._load_news_image(item.image, cached_only=True)
+            # Refreshed only after the saved feed is shown, so it can never overwrite fresh news.
+            self.tasks.submit_io(
+                "task.news_feed",
+                lambda ctx: asyncio.to_thread(fetch_news, url, self._news_cache),
+                on_done=self._on_news_fetched,
+            )
+
+        self.tasks.submit_io(
+            "task.news_cache",
+            lambda ctx: asyncio.to_thread(read_cached_news, url),
+            priority=TASK_PRIORITY_HIGH,
+            on_done=cached,
+        )
+
+    def _on_news_fetched(self, task: BackgroundTask) -> None:
+        if task.state == TASK_FAILED:
+            if not self.root.ids.get("news_list") or not self.root.ids["news_list"].children:
+                self.root.set_news_status("store.error")
+            else:
+                self.root.set_news_status("store.offline")
+            return
+        if task.state != TASK_DONE:
+            return
+        items, offline = task.result
+        self.root.show_news(items)
+        if not items:
+            self.root.set_news_status("store.empty")
+        else:
+            self.root.set_news_status("store.offline" if offline else "")
+        for item in items:
+            if item.image:
+                self._load_news_image(item.image)
+
+    def _load_news_image(self, url: str, cached_only: bool = False) -> None:
+        def fetched(task: BackgroundTask) -> None:
+            result: FetchResult | None = task.result if task.state == TASK_DONE else None
+            # An unchanged image that is already on screen needs no second decode.
+            if result is None or (result.from_cache and url in self._news_shown):
+                return
+            self._news_shown.add(url)
+            self.tasks.submit_cpu(
+                "task.decode_news_image",
+                decode_news_image_task,
+                result.data,
+                priority=TASK_PRIORITY_LOW,
+                on_done=decoded,
+            )
+
+        def decoded(task: BackgroundTask) -> None:
+            if task.state != TASK_DONE:
+                return
+            ext = Path(urllib.parse.urlparse(url).path).suffix.lstrip(".") or "png"
+            try:
+                texture = texture_from_image(task.result, ext)
+            except Exception:
+                return
+            self.root.set_news_image(url, texture)
+
+        self.tasks.submit_io(
+            "task.news_image",
+            lambda ctx: asyncio.to_thread(fetch_news_image, url, self._news_cache, cached_only),
+            priority=TASK_PRIORITY_LOW,
+            on_done=fetched,
+        )
+
     def _prepare_initial_dir(self) -> None:
         path = self.cfg.get("game_dir")
         if path:
@@ -670,18 +3881,35 @@ class WuwaLauncherApp(App):
                     codes.add(entry.name)
             return codes
 
-        languages = collect(LANG_DIR) | collect(USER_LANG_DIR) | {DEFAULT_LANG, FALLBACK_LANG}
+        bundled: set[str] = set()
+        if self.bundle:
+            for name in self.bundle.names("assets/lang/"):
+                parts = name.split("/")
+                if len(parts) == 4 and parts[3] == "messages.json":
+                    bundled.add(parts[2])
+        languages = bundled | collect(LANG_DIR) | collect(USER_LANG_DIR) | {DEFAULT_LANG, FALLBACK_LANG}
         return tuple(sorted(languages))
 
     def _load_language_file(self, code: str) -> dict[str, str]:
-        for base in (USER_LANG_DIR, LANG_DIR):
-            candidate = base / code / "messages.json"
-            if not candidate.exists():
-                continue
+        candidate = USER_LANG_DIR / code / "messages.json"
+        if candidate.exists():
             try:
                 return json.loads(candidate.read_text(encoding="utf-8"))
             except Exception:
-                continue
+                pass
+        if self.bundle:
+            try:
+                data = self.bundle.read_json(f"assets/lang/{code}/messages.json")
+            except Exception:
+                data = None
+            if data is not None:
+                return data
+        candidate = LANG_DIR / code / "messages.json"
+        if candidate.exists():
+            try:
+                return json.loads(candidate.read_text(encoding="utf-8"))
+            except Exception:
+                pass
         return {}
 
     def _refresh_language_maps(self):
@@ -706,13 +3934,7 @@ class WuwaLauncherApp(App):
         self._refresh_language_maps()
         if persist:
             self.cfg["language"] = normalized
-            try:
-                save_config(self.cfg)
-            except Exception as exc:
-                info_popup(
-                    self.translate("popup.save_error.title"),
-                    self.translate("popup.save_error.message", error=exc),
-                )
+            self.save_config_async(report_errors=True)
         if self.root:
             self.root.apply_translations()
 
@@ -742,50 +3964,36 @@ class WuwaLauncherApp(App):
             selected = selected.parent
         self.initial_dir = str(selected)
         self.cfg["game_dir"] = str(selected)
-        try:
-            save_config(self.cfg)
-        except Exception as exc:
-            info_popup(
-                self.translate("popup.save_error.title"),
-                self.translate("popup.save_error.message", error=exc),
-            )
+        self.save_config_async(report_errors=True)
         root: LauncherRoot = self.root
         root.game_dir = str(selected)
         root.apply_translations()
 
-    def open_directory_dialog(self) -> str:
+    def open_directory_dialog(self, callback: Callable[[str], None]) -> None:
         if sys.platform != "win32":
-            return ""
-        try:
-            import tkinter as tk
-            from tkinter import filedialog
-
-            root = tk.Tk()
-            root.withdraw()
-            try:
-                root.attributes('-topmost', True)
-            except Exception:
-                pass
-            path = filedialog.askdirectory(
-                title=self.translate("settings.select_folder"),
-                initialdir=self.initial_dir or str(Path.home()),
-            )
-            try:
-                root.destroy()
-            except Exception:
-                pass
-            return path or ""
-        except Exception as exc:
-            info_popup(
-                self.translate("popup.file_dialog.error.title"),
-                self.translate("popup.file_dialog.error.message", error=exc),
-            )
-            return ""
+            return
+        title = self.translate("settings.select_folder")
+        initial_dir = self.initial_dir or str(Path.home())
+        self._run_dialog(lambda filedialog: filedialog.askdirectory(title=title, initialdir=initial_dir), callback)
 
-    def open_image_dialog(self) -> str:
+    def open_image_dialog(self, callback: Callable[[str], None]) -> None:
         if sys.platform != "win32":
-            return ""
-        try:
+            return
+        title = self.translate("settings.change_background")
+        initial_dir = self.initial_dir or str(Path.home())
+        self._run_dialog(
+            lambda filedialog: filedialog.askopenfilename(
+                title=title,
+                initialdir=initial_dir,
+                filetypes=(("Image files", "*.png;*.jpg;*.jpeg;*.bmp;*.gif"), ("All files", "*.*")),
+            ),
+            callback,
+        )
+
+    def _run_dialog(self, ask: Callable[..., str], callback: Callable[[str], None]) -> None:
+        # The native dialog blocks its thread until the user answers, so it runs
+        # on a worker thread with its own Tk root instead of freezing the UI.
+        def show() -> str:
             import tkinter as tk
             from tkinter import filedialog
 
@@ -795,27 +4003,96 @@ class WuwaLauncherApp(App):
                 root.attributes('-topmost', True)
             except Exception:
                 pass
-            path = filedialog.askopenfilename(
-                title=self.translate("settings.change_background"),
-                initialdir=self.initial_dir or str(Path.home()),
-                filetypes=(("Image files", "*.png;*.jpg;*.jpeg;*.bmp;*.gif"), ("All files", "*.*")),
-            )
             try:
-                root.destroy()
-            except Exception:
-                pass
-            return path or ""
-        except Exception as exc:
-            info_popup(
-                self.translate("popup.file_dialog.error.title"),
-                self.translate("popup.file_dialog.error.message", error=exc),
-            )
-            return ""
+                return ask(filedialog) or ""
+            finally:
+                try:
+                    root.destroy()
+                except Exception:
+                    pass
+
+        def done(task: BackgroundTask) -> None:
+            if task.state == TASK_FAILED:
+                info_popup(
+                    self.translate("popup.file_dialog.error.title"),
+                    self.translate("popup.file_dialog.error.message", error=task.error),
+                )
+            elif task.state == TASK_DONE and task.result:
+                callback(task.result)
+
+        self.tasks.submit_io(
+            "task.file_dialog",
+            lambda ctx: asyncio.to_thread(show),
+            priority=TASK_PRIORITY_HIGH,
+            on_done=done,
+        )
 
     def select_background(self) -> None:
-        path = self.open_image_dialog()
-        if not path:
+        self.open_image_dialog(self._choose_background_file)
+
+    def _choose_background_file(self, path: str) -> None:
+        # Picked files are kept so they stay available in the gallery.
+        self.tasks.submit_io(
+            "task.keep_background",
+            lambda ctx: asyncio.to_thread(keep_background_copy, Path(path)),
+            priority=TASK_PRIORITY_LOW,
+        )
+        self._apply_background_file(path)
+
+    def load_gallery(self) -> None:
+        for task in self._gallery_tasks:
+            self.tasks.cancel(task)
+        self._gallery_tasks = []
+        dirs = gallery_dirs(self._existing_game_dir())
+        if self.root:
+            self.root.set_gallery_status("gallery.loading")
+        self.tasks.submit_io(
+            "task.list_gallery",
+            lambda ctx: asyncio.to_thread(list_gallery_images, dirs),
+            on_done=self._on_gallery_listed,
+        )
+
+    def _on_gallery_listed(self, task: BackgroundTask) -> None:
+        if task.state != TASK_DONE or not self.root:
             return
+        images: list[GalleryImage] = task.result
+        self.root.show_gallery(images)
+        missing = [image for image in images if not image.thumbnail]
+
+        def done(task: BackgroundTask, targets: dict[str, str]) -> None:
+            if task.state == TASK_DONE and self.root:
+                self.root.set_gallery_thumbnails({source: targets[source] for source in task.result})
+            if task in self._gallery_tasks and all(other.finished for other in self._gallery_tasks):
+                self.tasks.submit_io(
+                    "task.prune_thumbnails",
+                    lambda ctx: asyncio.to_thread(prune_thumbnail_cache),
+                    priority=TASK_PRIORITY_LOW,
+                )
+
+        # Small batches keep thumbnails appearing while the rest are still
+        # being built, newest images first.
+        for start in range(0, len(missing), THUMBNAIL_BATCH):
+            jobs = [
+                (image.path, str(thumbnail_cache_path(image.path, image.mtime_ns, image.size)))
+                for image in missing[start:start + THUMBNAIL_BATCH]
+            ]
+            self._gallery_tasks.append(
+                self.tasks.submit_cpu(
+                    "task.thumbnails",
+                    make_thumbnails,
+                    jobs,
+                    priority=TASK_PRIORITY_LOW,
+                    use_process=True,
+                    on_done=partial(done, targets=dict(jobs)),
+                )
+            )
+
+    def set_gallery_background(self, path: str) -> None:
+        self._apply_background_file(path)
+        if self.root:
+            self.root.set_gallery_status("gallery.applied")
+
+    def _apply_background_file(self, path: str) -> None:
         src = Path(path)
         dest = UI_ASSETS_DIR / f"{BACKGROUND_BASENAME}{src.suffix.lower()}"
         dest.parent.mkdir(parents=True, exist_ok=True)
@@ -837,12 +4114,511 @@ class WuwaLauncherApp(App):
                 self.translate("popup.save_error.message", error=exc),
             )
 
-    def _save_config_silent(self):
+    def open_storage_view(self) -> None:
+        root_dir = self._existing_game_dir()
+        if root_dir is None:
+            info_popup(
+                self.translate("popup.no_game_file.title"),
+                self.translate("popup.no_game_file.message"),
+            )
+            return
+        view = StorageView()
+        popup = Popup(title=self.translate("storage.title"), content=view, size_hint=(0.8, 0.8))
+        cache = load_disk_usage_cache(root_dir)
+        if cache:
+            view.show(summarize_disk_usage(cache), finished=False)
+        else:
+            view.status_text = self.translate("storage.scanning")
+        task = self.tasks.submit_cpu(
+            "task.disk_scan",
+            scan_disk_usage_task,
+            root_dir,
+            cache,
+            priority=TASK_PRIORITY_LOW,
+            on_progress=lambda task, summary: view.show(summary, finished=False),
+            on_done=lambda task: view.show(task.result, finished=True) if task.state == TASK_DONE else None,
+        )
+        popup.bind(on_dismiss=lambda *_: self.tasks.cancel(task))
+        popup.open()
+
+    def _existing_game_dir(self) -> Path | None:
+        game_dir = self.cfg.get("game_dir")
+        root_dir = Path(game_dir).expanduser() if game_dir else None
+        return root_dir if root_dir and root_dir.is_dir() else None
+
+    def open_performance_view(self) -> None:
+        game_dir = self._existing_game_dir()
+        if game_dir is None:
+            info_popup(
+                self.translate("popup.no_game_file.title"),
+                self.translate("popup.no_game_file.message"),
+            )
+            return
+        view = PerformanceView()
+        codes = ("",) + tuple(PERFORMANCE_PRESETS)
+        displays = {code: self.translate(f"performance.preset.{code or 'none'}") for code in codes}
+        view.preset_values = [displays[code] for code in codes]
+        view.preset_text = displays.get(self.cfg.get("performance_preset", ""), displays[""])
+        view.values_text = self.translate("performance.loading")
+        lookup = {display: code for code, display in displays.items()}
+
+        def select(display: str) -> None:
+            code = lookup.get(display, "")
+            if code != self.cfg.get("performance_preset", ""):
+                self.cfg["performance_preset"] = code
+                self._save_config_silent()
+
+        def reload(*_):
+            self.tasks.submit_io(
+                "task.read_game_settings",
+                lambda ctx: asyncio.to_thread(read_game_settings, game_dir),
+                on_done=lambda task: view.show_values(task.result if task.state == TASK_DONE else {}),
+            )
+
+        def apply_now(*_):
+            code = self.cfg.get("performance_preset", "")
+            if code not in PERFORMANCE_PRESETS:
+                return
+
+            def done(task: BackgroundTask) -> None:
+                if task.state == TASK_DONE:
+                    # No backup is taken when the files already hold the preset.
+                    view.status_text = self.translate("performance.applied" if task.result else "performance.unchanged")
+                    reload()
+
+            self.apply_performance_preset(code, done)
+
+        def restore(*_):
+            def done(task: BackgroundTask) -> None:
+                if task.state == TASK_DONE:
+                    view.status_text = self.translate("performance.restored" if task.result else "performance.no_backup")
+                    reload()
+                elif task.state == TASK_FAILED:
+                    view.status_text = self.translate("performance.error", error=task.error)
+
+            self.tasks.submit_io(
+                "task.restore_game_settings",
+                lambda ctx: asyncio.to_thread(self._restore_latest_settings, game_dir),
+                priority=TASK_PRIORITY_HIGH,
+                on_done=done,
+            )
+
+        view.ids.preset_spinner.bind(text=lambda spinner, text: select(text))
+        view.ids.apply_button.bind(on_release=apply_now)
+        view.ids.restore_button.bind(on_release=restore)
+        Popup(title=self.translate("performance.title"), content=view, size_hint=(0.7, 0.7)).open()
+        reload()
+
+    @staticmethod
+    def _restore_latest_settings(game_dir: Path) -> bool:
+        backup = latest_settings_backup(game_dir, pinned=True) or latest_settings_backup(game_dir)
+        if backup is None:
+            return False
+        restore_game_settings(backup, game_dir)
+        return True
+
+    def apply_performance_preset(self, code: str, on_done: Callable[[BackgroundTask], None]) -> None:
+        game_dir = self._existing_game_dir()
+        values = PERFORMANCE_PRESETS[code]
+
+        def done(task: BackgroundTask) -> None:
+            if task.state == TASK_FAILED and not isinstance(task.error, FileNotFoundError):
+                info_popup(
+                    self.translate("performance.title"),
+                    self.translate("performance.error", error=task.error),
+                )
+            on_done(task)
+
+        def apply() -> Path:
+            if game_dir is None:
+                raise FileNotFoundError(self.cfg.get("game_dir") or "")
+            return apply_game_settings(game_dir, values)
+
+        self.tasks.submit_io(
+            "task.apply_preset",
+            lambda ctx: asyncio.to_thread(apply),
+            priority=TASK_PRIORITY_HIGH,
+            on_done=done,
+        )
+
+    def track_game_process(self, process: subprocess.Popen) -> None:
+        profiles = load_launch_profiles(self.cfg)
+        profile = profiles.get(self.cfg.get("launch_profile") or "", profiles[DEFAULT_LAUNCH_PROFILE])
+
+        async def watch(ctx: TaskContext) -> None:
+            # The launched exe is only a stub, so the profile targets the shipping
+            # client it starts. If none shows up while the stub keeps running, the
+            # stub is treated as the game itself.
+            game_pid: int | None = None
+            deadline = time.monotonic() + GAME_CHILD_TIMEOUT
+            while game_pid is None and not ctx.cancelled.is_set():
+                game_pid = await asyncio.to_thread(find_child_process, process.pid, GAME_SHIPPING_EXE_NAME)
+                if game_pid is None and time.monotonic() >= deadline:
+                    if process.poll() is not None:
+                        return
+                    game_pid = process.pid
+                elif game_pid is None:
+                    await asyncio.sleep(GAME_POLL_INTERVAL)
+            if game_pid is None:
+                return
+            saved, errors = apply_launch_profile(profile, game_pid)
+            if self._launcher_state is None:
+                self._launcher_state = saved
+            self._show_launch_profile_errors(errors)
+            # Polling keeps shutdown from waiting on a thread blocked until the game exits.
+            while not ctx.cancelled.is_set():
+                running = process.poll() is None if game_pid == process.pid else process_running(game_pid)
+                if not running:
+                    break
+                await asyncio.sleep(GAME_POLL_INTERVAL)
+
+        def done(task: BackgroundTask) -> None:
+            if self._game_task is task:
+                self._game_task = None
+            self._show_launch_profile_errors(self.restore_launcher_state())
+
+        self._game_task = self.tasks.submit_io("task.game_running", watch, priority=TASK_PRIORITY_LOW, on_done=done)
+
+    def game_running(self) -> bool:
+        return self._game_task is not None
+
+    def restore_launcher_state(self) -> list[OSError]:
+        state, self._launcher_state = self._launcher_state, None
+        if state is None:
+            return []
+        errors: list[OSError] = []
+        # Restored separately: a refused priority change must not leave the affinity narrowed.
+        for priority, affinity in ((state.priority, ()), (None, state.affinity)):
+            try:
+                set_process_state(None, priority=priority, affinity=affinity)
+            except OSError as exc:
+                errors.append(exc)
+        return errors
+
+    def _show_launch_profile_errors(self, errors: Sequence[OSError]) -> None:
+        if errors:
+            info_popup(
+                self.translate("popup.launch_profile_error.title"),
+                self.translate("popup.launch_profile_error.message", error="\n".join(map(str, errors))),
+            )
+
+    def on_launch_profile_selected(self, name: str) -> None:
+        if not name or name == self.cfg.get("launch_profile"):
+            return
+        self.cfg["launch_profile"] = name
+        self._save_config_silent()
+
+    def open_mods_view(self) -> None:
+        game_dir = self._existing_game_dir()
+        if game_dir is None:
+            info_popup(
+                self.translate("popup.no_game_file.title"),
+                self.translate("popup.no_game_file.message"),
+            )
+            return
+        manager = ModManager(game_dir)
+        view = ModsView()
+        popup = Popup(title=self.translate("mods.title"), content=view, size_hint=(0.8, 0.8))
+
+        def reload(*_):
+            self.tasks.submit_io(
+                "task.list_mods",
+                lambda ctx: asyncio.to_thread(manager.list_mods),
+                on_done=lambda task: view.show(task.result, toggle) if task.state == TASK_DONE else None,
+            )
+
+        def report(task: BackgroundTask, message: str) -> None:
+            if task.state == TASK_FAILED:
+                view.status_text = self.translate("mods.error", error=task.error)
+            elif task.state == TASK_DONE:
+                view.status_text = message
+            reload()
+
+        def toggle(name: str, active: bool) -> None:
+            def done(task: BackgroundTask) -> None:
+                if task.state == TASK_DONE and task.result and active:
+                    owners = ", ".join(sorted(set(task.result.values())))
+                    message = self.translate("mods.conflict", name=name, count=len(task.result), mods=owners)
+                elif task.state == TASK_DONE and task.result:
+                    message = self.translate("mods.kept", name=name, files=", ".join(task.result))
+                else:
+                    message = self.translate("mods.enabled" if active else "mods.disabled", name=name)
+                report(task, message)
+
+            action = manager.enable if active else manager.disable
+            self.tasks.submit_io(
+                "task.toggle_mod",
+                lambda ctx: asyncio.to_thread(action, name),
+                priority=TASK_PRIORITY_HIGH,
+                on_done=done,
+            )
+
+        def import_chosen(path: str) -> None:
+            self.tasks.submit_io(
+                "task.import_mod",
+                lambda ctx: asyncio.to_thread(import_mod, Path(path)),
+                on_done=lambda task: report(task, self.translate("mods.imported", name=task.result)),
+            )
+
+        def rollback(*_):
+            self.tasks.submit_io(
+                "task.rollback_mods",
+                lambda ctx: asyncio.to_thread(manager.rollback),
+                priority=TASK_PRIORITY_HIGH,
+                on_done=lambda task: report(task, self.translate("mods.rolled_back")),
+            )
+
+        view.ids.import_button.bind(on_release=lambda *_: self.open_directory_dialog(import_chosen))
+        view.ids.rollback_button.bind(on_release=rollback)
+        reload()
+        popup.open()
+
+    def open_snapshots_view(self) -> None:
+        game_dir = self._existing_game_dir()
+        if game_dir is None:
+            info_popup(
+                self.translate("popup.no_game_file.title"),
+                self.translate("popup.no_game_file.message"),
+            )
+            return
+        view = SnapshotsView()
+        popup = Popup(title=self.translate("snapshots.title"), content=view, size_hint=(0.8, 0.8))
+        retention = self.cfg.get("snapshot_retention") or DEFAULT_SNAPSHOT_RETENTION
+
+        def reload(*_):
+            self.tasks.submit_io(
+                "task.list_snapshots",
+                lambda ctx: asyncio.to_thread(self.snapshots.list_snapshots, game_dir),
+                on_done=lambda task: view.show(task.result) if task.state == TASK_DONE else None,
+            )
+
+        def progress(task: BackgroundTask, counts: tuple[int, int]) -> None:
+            view.status_text = self.translate("snapshots.progress", done=counts[0], total=counts[1])
+
+        def create_snapshot(ctx: TaskContext) -> SnapshotInfo:
+            info = self.snapshots.create(game_dir, on_progress=lambda done, total: ctx.report(payload=(done, total)))
+            self.snapshots.prune(retention)
+            return info
+
+        def restore_snapshot(ctx: TaskContext, snapshot_id: str) -> tuple[int, int]:
+            # The current state is saved first so a restore can itself be undone.
+            self.snapshots.create(game_dir, label="before_restore")
+            return self.snapshots.restore(
+                snapshot_id, game_dir, on_progress=lambda done, total: ctx.report(payload=(done, total))
+            )
+
+        def finished(task: BackgroundTask, message: Callable[[Any], str]) -> None:
+            if task.state == TASK_DONE:
+                view.status_text = message(task.result)
+            elif task.state == TASK_FAILED:
+                view.status_text = self.translate("snapshots.error", error=task.error)
+            reload()
+
+        def create(*_):
+            self.tasks.submit_cpu(
+                "task.create_snapshot",
+                create_snapshot,
+                on_progress=progress,
+                on_done=lambda task: finished(
+                    task, lambda info: self.translate("snapshots.created", new=format_size(info.new_bytes))
+                ),
+            )
+
+        def restore(*_):
+            snapshot_id = view.lookup.get(view.ids.snapshot_spinner.text)
+            if not snapshot_id:
+                return
+            # The game keeps its databases open; swapping them and their WAL files underneath it corrupts them.
+            if self.game_running():
+                view.status_text = self.translate("snapshots.game_running")
+                return
+            self.tasks.submit_cpu(
+                "task.restore_snapshot",
+                restore_snapshot,
+                snapshot_id,
+                priority=TASK_PRIORITY_HIGH,
+                on_progress=progress,
+                on_done=lambda task: finished(
+                    task, lambda result: self.translate("snapshots.restored", written=result[0], removed=result[1])
+                ),
+            )
+
+        view.ids.create_button.bind(on_release=create)
+        view.ids.restore_button.bind(on_release=restore)
+        reload()
+        popup.open()
+
+    def open_task_view(self) -> None:
+        view = TaskListView()
+        popup = Popup(title=self.translate("tasks.title"), content=view, size_hint=(0.6, 0.6))
+        self.tasks.add_listener(view.on_task_changed)
+        popup.bind(on_dismiss=lambda *_: self.tasks.remove_listener(view.on_task_changed))
+        view.refresh()
+        popup.open()
+
+    def open_move_view(self) -> None:
+        src = self._existing_game_dir()
+        if src is None:
+            info_popup(
+                self.translate("popup.no_game_file.title"),
+                self.translate("popup.no_game_file.message"),
+            )
+            return
+        if self.game_running() or (self.root and self.root.moving):
+            info_popup(
+                self.translate("popup.move_error.title"),
+                self.translate("popup.move_error.message", error=self.translate("move.busy")),
+            )
+            return
+        # Linked mod files would arrive as plain copies and no longer match the mod manifest.
+        if ModManager(src).enabled_mods():
+            info_popup(
+                self.translate("popup.move_error.title"),
+                self.translate("popup.move_error.message", error=self.translate("move.mods_enabled")),
+            )
+            return
+        pending = self.cfg.get("pending_move") or {}
+        if pending.get("src") == str(src) and pending.get("dest"):
+            self._prompt_pending_move(src, Path(pending["dest"]))
+            return
+
+        def chosen(path: str) -> None:
+            dest = Path(path) / src.name
+            error = None
+            if is_inside(dest, src):
+                error = "move.inside_source"
+            elif dest.exists() and (not dest.is_dir() or any(dest.iterdir())):
+                # Existing files would be merged into the game, and a cancel could not tell them apart.
+                error = "move.dest_not_empty"
+            if error:
+                info_popup(
+                    self.translate("popup.move_error.title"),
+                    self.translate("popup.move_error.message", error=self.translate(error, dest=dest)),
+                )
+                return
+            self._start_move(src, dest)
+
+        self.open_directory_dialog(chosen)
+
+    def _prompt_pending_move(self, src: Path, dest: Path) -> None:
+        view = MoveResumeView()
+        view.status_text = self.translate("move.pending", dest=dest)
+        popup = Popup(title=self.translate("move.title"), content=view, size_hint=(0.6, 0.35))
+
+        def resume(*_):
+            popup.dismiss()
+            self._start_move(src, dest)
+
+        def cancel(*_):
+            popup.dismiss()
+            self._cancel_pending_move(src, dest)
+
+        view.ids.resume_button.bind(on_release=resume)
+        view.ids.cancel_button.bind(on_release=cancel)
+        popup.open()
+
+    def _cancel_pending_move(self, src: Path, dest: Path) -> None:
+        self.cfg.pop("pending_move", None)
+        self.save_config_async()
+        self.tasks.submit_io("task.move_discard", lambda ctx: asyncio.to_thread(discard_partial_move, src, dest))
+
+    def _start_move(self, src: Path, dest: Path) -> None:
+        # Recorded before copying starts so the next attempt resumes into the same folder.
+        self.cfg["pending_move"] = {"src": str(src), "dest": str(dest)}
+        self.save_config_async()
+        if self.root:
+            self.root.moving = True
+        view = MoveView()
+        view.status_text = self.translate("move.copying", dest=dest)
+        popup = Popup(title=self.translate("move.title"), content=view, size_hint=(0.6, 0.4), auto_dismiss=False)
+
+        def done(task: BackgroundTask) -> None:
+            if task.state == TASK_DONE and task.result:
+                view.progress = 1.0
+                view.status_text = self.translate("move.finishing")
+                self._finish_move(src, dest, lambda: popup.dismiss())
+                return
+            if task.state == TASK_FAILED:
+                view.status_text = self.translate("move.error", error=task.error)
+            else:
+                view.status_text = self.translate("move.paused")
+            if self.root:
+                self.root.moving = False
+
+        task = self.tasks.submit_io(
+            "task.move_install",
+            lambda ctx: move_installation_task(ctx, src, dest),
+            on_progress=lambda task, progress: view.show(progress),
+            on_done=done,
+        )
+
+        def close(*_):
+            if task.state in (TASK_QUEUED, TASK_RUNNING):
+                self.tasks.cancel(task)
+            popup.dismiss()
+
+        view.ids.close_button.bind(on_release=close)
+        popup.open()
+
+    def _finish_move(self, src: Path, dest: Path, on_done: Callable[[], None]) -> None:
+        self.cfg["game_dir"] = str(dest)
+        self.cfg.pop("pending_move", None)
+        self.initial_dir = str(dest)
+        snapshot = copy.deepcopy(self.cfg)
+
+        async def commit(ctx: TaskContext) -> None:
+            # The old copy is only deleted once the new location is safely on disk.
+            async with self._config_lock:
+                await asyncio.to_thread(save_config, snapshot)
+            # Snapshots and settings backups are keyed by game directory and must follow the move.
+            await asyncio.to_thread(self.snapshots.rekey, src, dest)
+            await asyncio.to_thread(rekey_settings_backups, src, dest)
+            if src.exists():
+                await asyncio.to_thread(shutil.rmtree, src, True)
+
+        def done(task: BackgroundTask) -> None:
+            if task.state == TASK_FAILED:
+                info_popup(
+                    self.translate("popup.save_error.title"),
+                    self.translate("popup.save_error.message", error=task.error),
+                )
+            if self.root:
+                self.root.game_dir = str(dest)
+                self.root.moving = False
+                self.root.apply_translations()
+            on_done()
+
+        self.tasks.submit_io("task.move_commit", commit, priority=TASK_PRIORITY_HIGH, on_done=done)
+
+    def save_config_async(self, report_errors: bool = False) -> None:
+        if not self.tasks.started:
+            self._save_config_now()
+            return
+        snapshot = copy.deepcopy(self.cfg)
+
+        async def write(ctx: TaskContext) -> None:
+            # Saves are serialised so an older snapshot never lands after a newer one.
+            async with self._config_lock:
+                await asyncio.to_thread(save_config, snapshot)
+
+        def done(task: BackgroundTask) -> None:
+            if report_errors and task.state == TASK_FAILED:
+                info_popup(
+                    self.translate("popup.save_error.title"),
+                    self.translate("popup.save_error.message", error=task.error),
+                )
+
+        self.tasks.submit_io("task.save_config", write, priority=TASK_PRIORITY_HIGH, on_done=done)
+
+    def _save_config_now(self):
         try:
             save_config(self.cfg)
         except Exception:
             pass
 
+    def _save_config_silent(self):
+        self._save_trigger()
+
     def _on_window_resize(self, window, width, height):
         self.cfg["window_size"] = [int(width), int(height)]
         self._save_config_silent()
@@ -858,7 +4634,7 @@ class WuwaLauncherApp(App):
         except Exception:
             pass
 
-    def background_path(self) -> Path | None:
+    def background_path(self) -> Path | BundledAsset | None:
         configured = self.cfg.get("background_image")
         if configured:
             candidate = Path(configured).expanduser()
@@ -869,18 +4645,24 @@ class WuwaLauncherApp(App):
         user_matches = sorted(UI_ASSETS_DIR.glob(f"{BACKGROUND_BASENAME}.*"))
         if user_matches:
             return user_matches[0]
+        if self.bundle:
+            prefix = DEFAULT_ASSETS_UI_DIR.relative_to(BASE_PATH).as_posix() + f"/{BACKGROUND_BASENAME}."
+            bundled = self.bundle.names(prefix)
+            if bundled:
+                return self.bundle.asset(bundled[0])
         default_matches = sorted(DEFAULT_ASSETS_UI_DIR.glob(f"{BACKGROUND_BASENAME}.*"))
         return default_matches[0] if default_matches else None
 
 
 
     def on_stop(self):
-        try:
-            save_config(self.cfg)
-        except Exception:
-            pass
+        self._save_trigger.cancel()
+        self.restore_launcher_state()
+        self.tasks.shutdown()
+        self._save_config_now()
 
 def main():
+    multiprocessing.freeze_support()
     WuwaLauncherApp().run()
 
 